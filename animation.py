@@ -4,11 +4,28 @@
 import pygame
 
 
+PROJECTILE_RADIUS = 5
+ATTACK_FRAMES = 20  # Frames per attack (0.05 progress per frame)
+ANIMATION_CAPACITY = 64  # Preallocated attack slots
+
+
 class Animation:
     """Manages visual animations for attacks"""
     
     def __init__(self):
-        self.active_animations = []
+        # Attacks live in a preallocated ring of slots stored as parallel
+        # lists (one entry per projectile), each slot with its own waypoint
+        # buffer: adding or retiring an attack overwrites slots in place
+        # instead of allocating new lists
+        self.starts = [None] * ANIMATION_CAPACITY  # (x, y) screen coordinates
+        self.colors = [None] * ANIMATION_CAPACITY  # RGB tuples
+        self.waypoints = [[None] * ATTACK_FRAMES for _ in range(ANIMATION_CAPACITY)]  # Integer position per frame
+        self.frames = [0] * ANIMATION_CAPACITY  # Frames elapsed (0 to ATTACK_FRAMES)
+        self.head = 0  # Slot of the oldest live attack
+        self.count = 0  # Number of live attacks
+        
+        # Projectile circles are pre-rendered once per color
+        self._sprites = {}
     
     def add_attack(self, source_pos, target_pos, color):
         """
@@ -19,21 +36,42 @@ class Animation:
         - target_pos: (x, y) screen coordinates
         - color: RGB tuple
         """
-        self.active_animations.append({
-            'type': 'attack',
-            'start': source_pos,
-            'end': target_pos,
-            'color': color,
-            'progress': 0.0,
-            'speed': 0.05  # Animation speed (0-1 per frame)
-        })
+        if self.count == ANIMATION_CAPACITY:
+            # Every slot is busy: recycle the oldest attack
+            self.head = (self.head + 1) % ANIMATION_CAPACITY
+            self.count -= 1
+        
+        slot = (self.head + self.count) % ANIMATION_CAPACITY
+        self.starts[slot] = source_pos
+        self.colors[slot] = color
+        self.frames[slot] = 0
+        
+        # Speed is constant, so every frame's projectile position is known
+        # up front (linear interpolation, truncated to pixels), written into
+        # the slot's waypoint buffer
+        start_x, start_y = source_pos
+        delta_x = target_pos[0] - start_x
+        delta_y = target_pos[1] - start_y
+        waypoints = self.waypoints[slot]
+        for frame in range(ATTACK_FRAMES):
+            waypoints[frame] = (int(start_x + delta_x * frame / ATTACK_FRAMES),
+                                int(start_y + delta_y * frame / ATTACK_FRAMES))
+        self.count += 1
     
     def update(self):
         """Update all animations (call each frame)"""
-        for anim in self.active_animations[:]:
-            anim['progress'] += anim['speed']
-            if anim['progress'] >= 1.0:
-                self.active_animations.remove(anim)
+        if not self.count:
+            return
+        
+        frames = self.frames
+        for slot in self._live_slots():
+            frames[slot] += 1
+        
+        # Every attack moves at the same speed, so they finish in the order
+        # they were added: retire finished slots from the head of the ring
+        while self.count and frames[self.head] >= ATTACK_FRAMES:
+            self.head = (self.head + 1) % ANIMATION_CAPACITY
+            self.count -= 1
     
     def draw(self, screen):
         """
@@ -43,25 +81,45 @@ class Animation:
         - Line from start to current position
         - Circle at current position (projectile)
         """
-        for anim in self.active_animations:
-            if anim['type'] == 'attack':
-                start_x, start_y = anim['start']
-                end_x, end_y = anim['end']
-                progress = anim['progress']
-                
-                # Calculate current position (linear interpolation)
-                current_x = start_x + (end_x - start_x) * progress
-                current_y = start_y + (end_y - start_y) * progress
-                
-                # Draw line from start to current position
-                pygame.draw.line(screen, anim['color'], 
-                               (start_x, start_y), 
-                               (current_x, current_y), 3)
-                
-                # Draw moving circle at current position
-                pygame.draw.circle(screen, anim['color'], 
-                                 (int(current_x), int(current_y)), 5)
+        if not self.count:
+            return
+        
+        projectiles = []
+        
+        for slot in self._live_slots():
+            color = self.colors[slot]
+            current_x, current_y = self.waypoints[slot][self.frames[slot]]
+            
+            # Draw line from start to current position
+            pygame.draw.line(screen, color,
+                           self.starts[slot],
+                           (current_x, current_y), 3)
+            
+            projectiles.append((self._projectile_sprite(color),
+                                (current_x - PROJECTILE_RADIUS,
+                                 current_y - PROJECTILE_RADIUS)))
+        
+        # Draw all moving circles in one batched blit
+        screen.blits(projectiles, doreturn=False)
+    
+    def _live_slots(self):
+        """Slot indices of live attacks, oldest first"""
+        end = self.head + self.count
+        if end <= ANIMATION_CAPACITY:
+            return range(self.head, end)
+        return [*range(self.head, ANIMATION_CAPACITY), *range(end - ANIMATION_CAPACITY)]
+    
+    def _projectile_sprite(self, color):
+        """Get (or build once) the pre-rendered projectile circle for a color"""
+        sprite = self._sprites.get(color)
+        if sprite is None:
+            diameter = PROJECTILE_RADIUS * 2 + 1
+            sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color,
+                             (PROJECTILE_RADIUS, PROJECTILE_RADIUS), PROJECTILE_RADIUS)
+            self._sprites[color] = sprite
+        return sprite
     
     def is_playing(self):
         """Check if any animations are playing"""
-        return len(self.active_animations) > 0
\ No newline at end of file
+        return self.count > 0
\ No newline at end of file
@@ -26,6 +26,18 @@ DARK_RED = (180, 30, 30)
 PURPLE = (200, 100, 255)
 ORANGE = (255, 165, 0)
 
+# Owner codes (planet owners and the side to move)
+OWNER_NEUTRAL = 0
+OWNER_PLAYER = 1
+OWNER_AI = 2
+OWNER_NAMES = ('neutral', 'player', 'ai')  # Indexed by owner code, for UI/logging
+
+# Loop timing
+FPS = 60  # Render cap
+LOGIC_STEP_MS = 1000 / 60  # Fixed game-logic step (timers count these steps)
+MAX_LOGIC_STEPS = 8  # Logic steps run per frame at most (drop time after a stall)
+MENU_IDLE_WAIT_MS = 100  # Longest the menu sleeps waiting for an event
+
 # Game settings
 MAX_TURNS = 30  # 25 turns per player
 WIN_CONDITION_PLANETS = 12
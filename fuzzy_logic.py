@@ -1,6 +1,149 @@
 # fuzzy_logic.py
 # Fuzzy Logic System for decision making
 
+from constants import BOARD_SIZE
+
+
+def _position_bonus(x, y):
+    """Additive strategic-value bonus for a grid cell"""
+    if 1 <= x <= 2 and 1 <= y <= 2:
+        return 2  # Center bonus
+    if x == 0 or x == 3 or y == 0 or y == 3:
+        return -0.5  # Border penalty (more vulnerable)
+    return 1  # Near center bonus
+
+
+# Position bonus per cell, indexed [y][x]. Border and center cells never
+# overlap, so size + bonus (floored at 1) reproduces the original rules
+_POSITION_BONUS = tuple(
+    tuple(_position_bonus(x, y) for x in range(BOARD_SIZE))
+    for y in range(BOARD_SIZE)
+)
+
+# ========== Scalar Kernels ==========
+# Module-level functions over plain floats/ints: no attribute or method
+# lookups in the AI hot loop
+
+
+def _strength_all(ship_ratio):
+    """
+    Fused (weak, medium, strong) memberships for a ship ratio
+    
+    The knees at 0.3/0.6/0.9 split the domain into four regions, so one
+    comparison chain yields all three degrees.
+    """
+    if ship_ratio <= 0.3:
+        return (1.0, 0.0, 0.0)
+    if ship_ratio <= 0.6:
+        return ((0.6 - ship_ratio) / 0.3, (ship_ratio - 0.3) / 0.3, 0.0)
+    if ship_ratio <= 0.9:
+        return (0.0, (0.9 - ship_ratio) / 0.3, (ship_ratio - 0.6) / 0.3)
+    return (0.0, 0.0, 1.0)
+
+
+def _value_all(value):
+    """Fused (low, medium, high) memberships for a strategic value (knees 2/4/6)"""
+    if value <= 2:
+        return (1.0, 0.0, 0.0)
+    if value <= 4:
+        return ((4 - value) / 2, (value - 2) / 2, 0.0)
+    if value <= 6:
+        return (0.0, (6 - value) / 2, (value - 4) / 2)
+    return (0.0, 0.0, 1.0)
+
+
+def _phase_all(turn):
+    """Fused (early, mid, late) memberships for a turn number (knees 10/20/35)"""
+    if turn <= 10:
+        return (1.0, 0.0, 0.0)
+    if turn <= 20:
+        return ((20 - turn) / 10, (turn - 10) / 10, 0.0)
+    if turn <= 35:
+        return (0.0, (35 - turn) / 15, (turn - 20) / 15)
+    return (0.0, 0.0, 1.0)
+
+
+def _aggressiveness(weak, medium_strength, strong,
+                    low_value, medium_value, high_value,
+                    early, mid, late):
+    """
+    Apply the IF-THEN rule base to membership degrees and defuzzify
+    
+    Returns: crisp aggressiveness (0.0 to 1.0)
+    """
+    # Rules are grouped by the strength/phase membership that gates them,
+    # and a group is skipped when its gate is zero (its rules can only
+    # produce 0). Rules 7 and 8 are each bounded by another rule with
+    # the same output (min(late, x) <= x), so they can never raise an
+    # activation and are not evaluated.
+    
+    # Rule 1: If planet is STRONG, aggressiveness is LOW
+    # (Rule 8: If game is LATE and planet is STRONG, aggressiveness is LOW)
+    low_agg = strong
+    medium_agg = 0.0
+    high_agg = 0.0
+    
+    if weak > 0:
+        # Rule 2: If planet is WEAK and value is HIGH, aggressiveness is HIGH
+        # (Rule 7: ... and game is LATE, aggressiveness is HIGH)
+        high_agg = min(weak, high_value)
+        
+        # Rule 3: If planet is WEAK and value is LOW, aggressiveness is MEDIUM
+        medium_agg = min(weak, low_value)
+        
+        # Rule 6: If game is EARLY and planet is WEAK, aggressiveness is HIGH
+        high_agg = max(high_agg, min(early, weak))
+    
+    if medium_strength > 0:
+        # Rule 4: If planet is MEDIUM strength and value is HIGH, aggressiveness is MEDIUM
+        medium_agg = max(medium_agg, min(medium_strength, high_value))
+        
+        # Rule 5: If planet is MEDIUM strength and value is LOW, aggressiveness is LOW
+        low_agg = max(low_agg, min(medium_strength, low_value))
+    
+    if mid > 0:
+        # Rule 9: If game is MID and value is MEDIUM, aggressiveness is MEDIUM
+        medium_agg = max(medium_agg, min(mid, medium_value))
+    
+    # ========== Defuzzification ==========
+    # Center of gravity over the fixed output centers
+    # (low 0.25, medium 0.5, high 0.85):
+    # (Σ activation_i * center_i) / (Σ activation_i)
+    denominator = low_agg + medium_agg + high_agg
+    if denominator == 0:
+        return 0.5  # Default medium aggressiveness
+    
+    return (low_agg * 0.25 + medium_agg * 0.5 + high_agg * 0.85) / denominator
+
+
+def _recommend_ships(aggressiveness, available_ships, target_ships, same_owner):
+    """Ship count kernel behind FuzzyLogic.get_ship_count_recommendation"""
+    if available_ships <= 0:
+        return 0
+    
+    if same_owner:
+        # Reinforcement - send based on aggressiveness
+        base_ships = int(available_ships * aggressiveness)
+    else:
+        # Attack - need to overcome defense
+        needed_to_capture = target_ships + 1
+        
+        if aggressiveness >= 0.7:
+            # High aggressiveness - overwhelming force
+            base_ships = min(available_ships, int(needed_to_capture * 1.5))
+        elif aggressiveness >= 0.4:
+            # Medium aggressiveness - moderate force
+            base_ships = min(available_ships, int(needed_to_capture * 1.2))
+        else:
+            # Low aggressiveness - minimal force or skip
+            if needed_to_capture < available_ships:
+                base_ships = needed_to_capture
+            else:
+                return 0
+    
+    return max(1, min(base_ships, available_ships))
+
+
 class FuzzyLogic:
     """
     Fuzzy Logic System for evaluating attack aggressiveness
@@ -14,109 +157,85 @@ class FuzzyLogic:
     - Aggressiveness: 0.0 to 1.0 (how aggressive to attack)
     """
     
+    # Turns past this point are fully "late", so the phase table stops here
+    PHASE_TABLE_SIZE = 36
+    
     def __init__(self, board):
         self.board = board
+        
+        # Membership lookup tables: all inputs come from small discrete
+        # domains (integer turns, ship-count ratios, planet values), so each
+        # membership triple is computed once and then looked up
+        self._phase_table = [_phase_all(turn) for turn in range(self.PHASE_TABLE_SIZE)]
+        self._strength_table = {}
+        self._value_table = {}
+        
+        # Strategic value only depends on a planet's fixed position and
+        # size, so its memberships are computed once per planet (by idx)
+        self._planet_values = [
+            self.value_memberships(self.calculate_strategic_value(planet))
+            for planet in board.planets
+        ]
     
     # ========== Membership Functions for Planet Strength ==========
+    # Thin wrappers: each degree is read from the fused triple, so the
+    # shapes are defined once (in _strength_all/_value_all/_phase_all)
     
     def planet_strength_weak(self, ship_ratio):
         """ship_ratio = target_ships / source_ships"""
-        if ship_ratio <= 0.3:
-            return 1.0
-        elif ship_ratio <= 0.6:
-            return (0.6 - ship_ratio) / 0.3
-        return 0.0
+        return _strength_all(ship_ratio)[0]
     
     def planet_strength_medium(self, ship_ratio):
-        if ship_ratio <= 0.3:
-            return 0.0
-        elif ship_ratio <= 0.6:
-            return (ship_ratio - 0.3) / 0.3
-        elif ship_ratio <= 0.9:
-            return (0.9 - ship_ratio) / 0.3
-        return 0.0
+        return _strength_all(ship_ratio)[1]
     
     def planet_strength_strong(self, ship_ratio):
-        if ship_ratio <= 0.6:
-            return 0.0
-        elif ship_ratio <= 0.9:
-            return (ship_ratio - 0.6) / 0.3
-        return 1.0
+        return _strength_all(ship_ratio)[2]
     
     # ========== Membership Functions for Strategic Value ==========
     
     def strategic_value_low(self, value):
         """value = size + position_bonus (0-6)"""
-        if value <= 2:
-            return 1.0
-        elif value <= 4:
-            return (4 - value) / 2
-        return 0.0
+        return _value_all(value)[0]
     
     def strategic_value_medium(self, value):
-        if value <= 2:
-            return 0.0
-        elif value <= 4:
-            return (value - 2) / 2
-        elif value <= 6:
-            return (6 - value) / 2
-        return 0.0
+        return _value_all(value)[1]
     
     def strategic_value_high(self, value):
-        if value <= 4:
-            return 0.0
-        elif value <= 6:
-            return (value - 4) / 2
-        return 1.0
+        return _value_all(value)[2]
     
     # ========== Membership Functions for Game Phase ==========
     
     def game_phase_early(self, turn):
         """turn = current turn number"""
-        if turn <= 10:
-            return 1.0
-        elif turn <= 20:
-            return (20 - turn) / 10
-        return 0.0
+        return _phase_all(turn)[0]
     
     def game_phase_mid(self, turn):
-        if turn <= 10:
-            return 0.0
-        elif turn <= 20:
-            return (turn - 10) / 10
-        elif turn <= 35:
-            return (35 - turn) / 15
-        return 0.0
+        return _phase_all(turn)[1]
     
     def game_phase_late(self, turn):
-        if turn <= 20:
-            return 0.0
-        elif turn <= 35:
-            return (turn - 20) / 15
-        return 1.0
+        return _phase_all(turn)[2]
     
-    # ========== Defuzzification ==========
+    # ========== Membership Lookups ==========
     
-    def defuzzify(self, low_activation, medium_activation, high_activation):
-        """
-        Convert fuzzy output to crisp value using center of gravity method
-        
-        Formula: (Σ activation_i * center_i) / (Σ activation_i)
-        """
-        # Output membership function centers
-        low_center = 0.25
-        medium_center = 0.5
-        high_center = 0.85
-        
-        numerator = (low_activation * low_center + 
-                    medium_activation * medium_center + 
-                    high_activation * high_center)
-        denominator = low_activation + medium_activation + high_activation
-        
-        if denominator == 0:
-            return 0.5  # Default medium aggressiveness
-        
-        return numerator / denominator
+    def strength_memberships(self, ship_ratio):
+        """Returns (weak, medium, strong) for a ship ratio"""
+        memberships = self._strength_table.get(ship_ratio)
+        if memberships is None:
+            memberships = _strength_all(ship_ratio)
+            self._strength_table[ship_ratio] = memberships
+        return memberships
+    
+    def value_memberships(self, value):
+        """Returns (low, medium, high) for a strategic value"""
+        memberships = self._value_table.get(value)
+        if memberships is None:
+            memberships = _value_all(value)
+            self._value_table[value] = memberships
+        return memberships
+    
+    def phase_memberships(self, turn):
+        """Returns (early, mid, late) for a turn number"""
+        return self._phase_table[min(turn, self.PHASE_TABLE_SIZE - 1)]
     
     # ========== Strategic Value Calculator ==========
     
@@ -130,20 +249,8 @@ class FuzzyLogic:
         - Near center bonus (+1)
         - Border penalty (-0.5)
         """
-        value = planet.size
         x, y = planet.get_position()
-        center_positions = [(1, 1), (1, 2), (2, 1), (2, 2)]
-        
-        if (x, y) in center_positions:
-            value += 2  # Center bonus
-        elif 0 < x < 3 and 0 < y < 3:
-            value += 1  # Near center bonus
-        
-        # Border planets get slight penalty (more vulnerable)
-        if x == 0 or x == 3 or y == 0 or y == 3:
-            value = max(1, value - 0.5)
-        
-        return value
+        return max(1, planet.size + _POSITION_BONUS[y][x])
     
     # ========== Main Fuzzy Evaluation ==========
     
@@ -158,64 +265,28 @@ class FuzzyLogic:
         
         Returns: aggressiveness score (0.0 to 1.0)
         """
+        phase = self.phase_memberships(self.board.turn // 2 + 1)
+        return self._evaluate(source.ships, target, phase)
+    
+    def _evaluate(self, source_ships, target, phase):
+        """Fuzzify, apply the rules and defuzzify for a single target"""
         # Calculate inputs
-        if source.ships == 0:
+        if source_ships == 0:
             ship_ratio = 1.0
         else:
-            ship_ratio = target.ships / source.ships
-        
-        strategic_value = self.calculate_strategic_value(target)
-        current_turn = self.board.turn // 2 + 1
+            ship_ratio = target.ships / source_ships
         
         # ========== Fuzzification ==========
-        weak = self.planet_strength_weak(ship_ratio)
-        medium_strength = self.planet_strength_medium(ship_ratio)
-        strong = self.planet_strength_strong(ship_ratio)
-        
-        low_value = self.strategic_value_low(strategic_value)
-        medium_value = self.strategic_value_medium(strategic_value)
-        high_value = self.strategic_value_high(strategic_value)
-        
-        early = self.game_phase_early(current_turn)
-        mid = self.game_phase_mid(current_turn)
-        late = self.game_phase_late(current_turn)
-        
-        # ========== Fuzzy Rules ==========
-        low_agg = 0.0
-        medium_agg = 0.0
-        high_agg = 0.0
-        
-        # Rule 1: If planet is STRONG, aggressiveness is LOW
-        low_agg = max(low_agg, strong)
-        
-        # Rule 2: If planet is WEAK and value is HIGH, aggressiveness is HIGH
-        high_agg = max(high_agg, min(weak, high_value))
-        
-        # Rule 3: If planet is WEAK and value is LOW, aggressiveness is MEDIUM
-        medium_agg = max(medium_agg, min(weak, low_value))
-        
-        # Rule 4: If planet is MEDIUM strength and value is HIGH, aggressiveness is MEDIUM
-        medium_agg = max(medium_agg, min(medium_strength, high_value))
-        
-        # Rule 5: If planet is MEDIUM strength and value is LOW, aggressiveness is LOW
-        low_agg = max(low_agg, min(medium_strength, low_value))
-        
-        # Rule 6: If game is EARLY and planet is WEAK, aggressiveness is HIGH
-        high_agg = max(high_agg, min(early, weak))
+        weak, medium_strength, strong = self.strength_memberships(ship_ratio)
+        low_value, medium_value, high_value = self._planet_values[target.idx]
+        early, mid, late = phase
         
-        # Rule 7: If game is LATE and planet is WEAK and HIGH value, aggressiveness is HIGH
-        high_agg = max(high_agg, min(late, min(weak, high_value)))
-        
-        # Rule 8: If game is LATE and planet is STRONG, aggressiveness is LOW
-        low_agg = max(low_agg, min(late, strong))
-        
-        # Rule 9: If game is MID and value is MEDIUM, aggressiveness is MEDIUM
-        medium_agg = max(medium_agg, min(mid, medium_value))
-        
-        # ========== Defuzzification ==========
-        aggressiveness = self.defuzzify(low_agg, medium_agg, high_agg)
-        
-        return aggressiveness
+        # ========== Fuzzy Rules + Defuzzification ==========
+        return _aggressiveness(
+            weak, medium_strength, strong,
+            low_value, medium_value, high_value,
+            early, mid, late
+        )
     
     def get_ship_count_recommendation(self, source, target, owner, aggressiveness):
         """
@@ -227,28 +298,5 @@ class FuzzyLogic:
         - Low aggressiveness (<0.4): Minimal force or skip
         """
         available_ships = source.ships - 1  # Must leave at least 1
-        
-        if available_ships <= 0:
-            return 0
-        
-        if target.owner == owner:
-            # Reinforcement - send based on aggressiveness
-            base_ships = int(available_ships * aggressiveness)
-        else:
-            # Attack - need to overcome defense
-            needed_to_capture = target.ships + 1
-            
-            if aggressiveness >= 0.7:
-                # High aggressiveness - overwhelming force
-                base_ships = min(available_ships, int(needed_to_capture * 1.5))
-            elif aggressiveness >= 0.4:
-                # Medium aggressiveness - moderate force
-                base_ships = min(available_ships, int(needed_to_capture * 1.2))
-            else:
-                # Low aggressiveness - minimal force or skip
-                if needed_to_capture < available_ships:
-                    base_ships = needed_to_capture
-                else:
-                    return 0
-        
-        return max(1, min(base_ships, available_ships))
\ No newline at end of file
+        return _recommend_ships(aggressiveness, available_ships,
+                                target.ships, target.owner == owner)
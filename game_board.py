@@ -2,9 +2,15 @@
 # Game board logic and state management
 
 import random
+from bisect import insort
 from models import Planet
 from pathfinding import AStarPathfinder
-from constants import BOARD_SIZE, MAX_TURNS, WIN_CONDITION_PLANETS
+from constants import (BOARD_SIZE, MAX_TURNS, WIN_CONDITION_PLANETS,
+                       OWNER_NEUTRAL, OWNER_PLAYER, OWNER_AI, OWNER_NAMES)
+
+
+def _planet_index(planet):
+    return planet.idx
 
 
 class GameBoard:
@@ -20,10 +26,17 @@ class GameBoard:
     """
     
     def __init__(self, ai_vs_ai=False):
-        self.grid = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        # Planets in row-major order; grid and planets are the same flat list,
+        # so the planet at (x, y) is grid[y * BOARD_SIZE + x]
         self.planets = []
+        self.grid = self.planets
+        # Planets grouped by owner, kept in board order so move generation
+        # only visits relevant planets instead of scanning the whole board
+        self.planets_by_owner = [[] for _ in OWNER_NAMES]  # Indexed by owner code
+        # Total planet size (ship production) per owner, updated on capture
+        self.production_by_owner = [0] * len(OWNER_NAMES)
         self.turn = 0
-        self.current_player = 'player'
+        self.current_player = OWNER_PLAYER
         self.selected_planet = None
         self.game_over = False
         self.winner = None
@@ -45,37 +58,55 @@ class GameBoard:
         for y in range(BOARD_SIZE):
             for x in range(BOARD_SIZE):
                 size = random.randint(1, 3)
-                planet = Planet(x, y, size)
-                self.grid[y][x] = planet
+                planet = Planet(x, y, size, idx=len(self.planets))
                 self.planets.append(planet)
+                self.planets_by_owner[OWNER_NEUTRAL].append(planet)
+                self.production_by_owner[OWNER_NEUTRAL] += size
         
         # Assign starting planets (opposite corners)
-        # Player gets top-left
-        self.grid[0][0].owner = 'player'
-        self.grid[0][0].ships = 10
-        self.grid[0][1].owner = 'player'
-        self.grid[0][1].ships = 8
-        
-        # AI gets bottom-right
-        self.grid[3][3].owner = 'ai'
-        self.grid[3][3].ships = 10
-        self.grid[3][2].owner = 'ai'
-        self.grid[3][2].ships = 8
+        # Player gets top-left, AI gets bottom-right
+        starts = (
+            (0, 0, OWNER_PLAYER, 10),
+            (1, 0, OWNER_PLAYER, 8),
+            (3, 3, OWNER_AI, 10),
+            (2, 3, OWNER_AI, 8),
+        )
+        for x, y, owner, ships in starts:
+            planet = self.get_planet_at(x, y)
+            self.set_owner(planet, owner)
+            planet.ships = ships
     
     def get_planet_at(self, x, y):
         """Get planet at grid coordinates"""
         if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE:
-            return self.grid[y][x]
+            return self.grid[y * BOARD_SIZE + x]
         return None
     
+    def set_owner(self, planet, owner):
+        """Change a planet's owner, keeping the per-owner indexes in sync"""
+        if planet.owner == owner:
+            return
+        self.planets_by_owner[planet.owner].remove(planet)
+        insort(self.planets_by_owner[owner], planet, key=_planet_index)
+        self.production_by_owner[planet.owner] -= planet.size
+        self.production_by_owner[owner] += planet.size
+        planet.owner = owner
+    
     def get_player_planets(self, owner):
         """Get all planets owned by a player"""
-        return [p for p in self.planets if p.owner == owner]
+        return list(self.planets_by_owner[owner])
+    
+    def count_by_owner(self, owner):
+        """Number of planets owned by owner (OWNER_NEUTRAL for unowned)"""
+        return len(self.planets_by_owner[owner])
     
     def generate_all_ships(self):
-        """Generate 1 ship per planet per turn"""
-        for planet in self.planets:
-            planet.generate_ships()
+        """Generate 1 ship per owned planet per turn (neutrals are skipped)"""
+        # Same capped increment as Planet.add_ships(1), inlined to avoid a
+        # method call per planet
+        for owner in (OWNER_PLAYER, OWNER_AI):
+            for planet in self.planets_by_owner[owner]:
+                planet.ships = min(planet.ships + 1, planet.max_ships)
     
     def attack(self, source, target, ship_count):
         """
@@ -116,7 +147,7 @@ class GameBoard:
             if ship_count > target.ships:
                 # Attacker wins
                 remaining = ship_count - target.ships
-                target.owner = source.owner
+                self.set_owner(target, source.owner)
                 target.ships = remaining
             else:
                 # Defender wins
@@ -137,7 +168,7 @@ class GameBoard:
         """
         self.generate_all_ships()
         self.turn += 1
-        self.current_player = 'ai' if self.current_player == 'player' else 'player'
+        self.current_player = OWNER_AI if self.current_player == OWNER_PLAYER else OWNER_PLAYER
         self.selected_planet = None
         self.check_game_over()
     
@@ -150,8 +181,8 @@ class GameBoard:
         2. Player has ≥12 planets
         3. Turn limit reached (50 turns per player)
         """
-        player_planets = len(self.get_player_planets('player'))
-        ai_planets = len(self.get_player_planets('ai'))
+        player_planets = self.count_by_owner(OWNER_PLAYER)
+        ai_planets = self.count_by_owner(OWNER_AI)
         
         if player_planets == 0:
             self.game_over = True
@@ -3,6 +3,7 @@
 
 import pygame
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from constants import *
 from game_board import GameBoard
 from minimax_ai import MinimaxAI
@@ -10,6 +11,11 @@ from animation import Animation
 from ui import UIRenderer
 from fuzzy_logic import FuzzyLogic
 
+# Window events after which the screen contents may have been lost, so the
+# next frame must be redrawn in full
+_REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN,
+                  pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSIZECHANGED)
+
 
 class Game:
     """Main game controller"""
@@ -37,10 +43,32 @@ class Game:
         self.ai_move_timer = 0
         self.paused = False  # For AI vs AI pause feature
         self.speed_multiplier = 1.0  # Speed control for AI vs AI
+        
+        # AI searches run on a worker thread so the window keeps rendering
+        # and handling events while the AI thinks
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._ai_future = None  # Pending search, or None
+        self._ai_turn = None  # (player, ai) the pending search belongs to
+        self._deferred_keys = []  # Board keys pressed during the search
+        
+        # Menu button rects from the last draw_menu (the layout is fixed)
+        self._menu_rects = None
+        
+        # Overlay text fonts, built once (rendered surfaces are cached by
+        # the UI's text cache)
+        self._fonts = {24: pygame.font.Font(None, 24), 36: pygame.font.Font(None, 36)}
+        
+        # Set whenever something visible changed; frames are only redrawn
+        # when it is set (or while the selected planet pulses)
+        self._dirty = True
+        # (paused banner shown, game over) as last drawn over the board
+        self._overlays = None
     
     def handle_menu_click(self, pos):
         """Handle clicks on menu screen"""
-        pvai_rect, aivai_rect, easy_rect, medium_rect, hard_rect = self.ui.draw_menu()
+        if self._menu_rects is None:
+            self._menu_rects = self.ui.draw_menu()
+        pvai_rect, aivai_rect, easy_rect, medium_rect, hard_rect = self._menu_rects
         
         # Check mode selection
         if pvai_rect.collidepoint(pos):
@@ -68,8 +96,8 @@ class Game:
         
         if self.game_mode == 'aivai':
             # Create two AI players with same difficulty; specify which owner each controls
-            self.ai_player = MinimaxAI(self.board, difficulty, owner='ai')  # Controls 'ai' side (RED)
-            self.ai_opponent = MinimaxAI(self.board, difficulty, owner='player')  # Controls 'player' side (BLUE)
+            self.ai_player = MinimaxAI(self.board, difficulty, owner=OWNER_AI)  # Controls 'ai' side (RED)
+            self.ai_opponent = MinimaxAI(self.board, difficulty, owner=OWNER_PLAYER)  # Controls 'player' side (BLUE)
             self.ai_move_timer = self.ai_move_delay
             print(f"\n=== AI vs AI Match Started ===")
             print(f"Difficulty: {difficulty.upper()}")
@@ -89,10 +117,12 @@ class Game:
         self.paused = False
         self.speed_multiplier = 1.0
         self.ai_thinking = False
+        self.cancel_ai_turn()
+        self._dirty = True
     
     def handle_board_click(self, pos):
         """Handle clicks on game board"""
-        if self.board.current_player != 'player':
+        if self.board.current_player != OWNER_PLAYER:
             return
         
         # Convert screen coordinates to grid coordinates
@@ -104,7 +134,7 @@ class Game:
             
             if self.board.selected_planet is None:
                 # Select source planet
-                if planet.owner == 'player' and planet.ships > 1:
+                if planet.owner == OWNER_PLAYER and planet.ships > 1:
                     self.board.selected_planet = planet
                     self.message_display = f"Selected planet at {planet.get_position()}"
                     self.message_timer = 60
@@ -161,28 +191,59 @@ class Game:
             self.message_timer = 120
     
     def execute_ai_turn(self, player):
-        """Execute AI's turn for specified player"""
+        """
+        Start AI's turn for specified player
+        
+        The minimax search runs in the background on a snapshot of the
+        board; finish_ai_turn applies its move once the search is done.
+        """
+        if self._ai_future is not None:
+            return  # Already thinking
+        
         # Select correct AI based on player
-        if player == 'ai':
+        if player == OWNER_AI:
             ai = self.ai_player
+        else:  # player == OWNER_PLAYER
+            ai = self.ai_opponent
+        
+        # Get best move using minimax (the search mutates the board it
+        # explores, so it never touches the board being rendered)
+        snapshot = ai.copy_board(self.board)
+        self._ai_future = self._executor.submit(ai.get_best_move, snapshot)
+        self._ai_turn = (player, ai)
+    
+    def cancel_ai_turn(self):
+        """Discard any pending AI search (its result is never applied)"""
+        self._ai_future = None
+        self._ai_turn = None
+        self._deferred_keys = []
+    
+    def finish_ai_turn(self):
+        """Apply the finished AI search's move and end the AI's turn"""
+        best_move = self._ai_future.result()
+        player, ai = self._ai_turn
+        deferred_keys = self._deferred_keys
+        self.cancel_ai_turn()
+        self._dirty = True
+        
+        if player == OWNER_AI:
             ai_name = "AI RED"
             color_for_anim = RED
-        else:  # player == 'player'
-            ai = self.ai_opponent
+        else:  # player == OWNER_PLAYER
             ai_name = "AI BLUE"
             color_for_anim = BLUE
         
-        # Get best move using minimax
-        best_move = ai.get_best_move()
-        
         if best_move:
+            # Map the snapshot's planets back onto the live board
             source, target, ships = best_move
+            source = self.board.planets[source.idx]
+            target = self.board.planets[target.idx]
             
             # Debug output
             aggressiveness = ai.fuzzy.evaluate_attack(source, target, player)
             print(f"\n=== {ai_name} MOVE (Turn {self.board.turn // 2 + 1}) ===")
             print(f"From: {source.get_position()} ({source.ships} ships)")
-            print(f"To: {target.get_position()} ({target.ships} ships, Owner: {target.owner})")
+            print(f"To: {target.get_position()} ({target.ships} ships, Owner: {OWNER_NAMES[target.owner]})")
             print(f"Sending: {ships} ships")
             print(f"Aggressiveness: {aggressiveness:.2f}")
             
@@ -210,6 +271,26 @@ class Game:
             self.ai_move_timer = int(self.ai_move_delay / self.speed_multiplier)
         else:
             self.ai_thinking = False
+        
+        # Keys held back during the search now act on the updated board
+        for event in deferred_keys:
+            pygame.event.post(event)
+    
+    def toggle_pause(self):
+        """Pause or resume AI vs AI mode"""
+        self.paused = not self.paused
+        status = "PAUSED" if self.paused else "RESUMED"
+        self.message_display = f"Game {status}"
+        self.message_timer = 60
+    
+    def change_speed(self, key):
+        """Speed AI vs AI up (+) or slow it down (-)"""
+        if key == pygame.K_MINUS:
+            self.speed_multiplier = max(0.25, self.speed_multiplier / 1.5)
+        else:
+            self.speed_multiplier = min(4.0, self.speed_multiplier * 1.5)
+        self.message_display = f"Speed: {self.speed_multiplier:.1f}x"
+        self.message_timer = 60
     
     def show_fuzzy_analysis(self):
         """Show fuzzy logic analysis (debug feature)"""
@@ -220,12 +301,12 @@ class Game:
         aggressiveness = fuzzy.evaluate_attack(
             self.board.selected_planet, 
             self.target_planet, 
-            'player'
+            OWNER_PLAYER
         )
         recommended = fuzzy.get_ship_count_recommendation(
             self.board.selected_planet,
             self.target_planet,
-            'player',
+            OWNER_PLAYER,
             aggressiveness
         )
         strategic_value = fuzzy.calculate_strategic_value(self.target_planet)
@@ -237,25 +318,93 @@ class Game:
         print(f"Aggressiveness: {aggressiveness:.2f}")
         print(f"Recommended Ships: {recommended}")
     
+    def update(self):
+        """Advance game logic by one fixed step (LOGIC_STEP_MS)"""
+        if self.animation.is_playing():
+            # Projectiles moved (or the last one just finished)
+            self._dirty = True
+        self.animation.update()
+        if self.message_timer > 0:
+            self.message_timer -= 1
+            if self.message_timer == 0:
+                self._dirty = True  # Message disappears
+        
+        # AI turn execution
+        if self._ai_future is not None:
+            # Search running in the background: apply it once finished
+            if self._ai_future.done():
+                self.finish_ai_turn()
+        elif self.board and not self.board.game_over:
+            if self.board.ai_vs_ai:
+                # AI vs AI mode - both sides are AI
+                if not self.paused:
+                    self.ai_move_timer -= 1
+                    if self.ai_move_timer <= 0:
+                        # Start current player's AI turn
+                        self.execute_ai_turn(self.board.current_player)
+            else:
+                # Player vs AI mode - only execute if it's AI's turn
+                if self.board.current_player == OWNER_AI and self.ai_thinking:
+                    self.execute_ai_turn(OWNER_AI)
+    
     def run(self):
-        """Main game loop"""
+        """
+        Main game loop
+        
+        Logic advances in fixed LOGIC_STEP_MS steps fed by the real elapsed
+        time, independent of how often frames are rendered; rendering is
+        capped at FPS. The menu has nothing to animate once its message has
+        expired, so it sleeps until an event arrives (or MENU_IDLE_WAIT_MS)
+        instead of polling.
+        """
         running = True
+        logic_time = 0.0  # Elapsed time not yet consumed by logic steps
+        self.clock.tick()
         
         while running:
             # Event handling
-            for event in pygame.event.get():
+            if self.state == 'menu' and self.message_timer <= 0:
+                events = [pygame.event.wait(MENU_IDLE_WAIT_MS)]
+                events.extend(pygame.event.get())
+            else:
+                events = pygame.event.get()
+            
+            # Clicks queued within one frame collapse into the last one
+            click_pos = None
+            
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 
-                if self.state == 'menu':
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        self.handle_menu_click(event.pos)
+                # Input and window events may change what is shown
+                if event.type != pygame.NOEVENT and event.type != pygame.MOUSEMOTION:
+                    self._dirty = True
+                if event.type in _REDRAW_EVENTS:
+                    self.ui.invalidate()
+                
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    click_pos = event.pos
                 
                 elif self.state == 'playing':
-                    if event.type == pygame.MOUSEBUTTONDOWN and not self.board.game_over:
-                        # Only allow clicks in Player vs AI mode
-                        if not self.board.ai_vs_ai:
-                            self.handle_board_click(event.pos)
+                    if self._ai_future is not None:
+                        # AI is thinking: the board is about to change, so
+                        # board keys wait until the move is applied. Leaving
+                        # to the menu and pausing AI vs AI discard the pending
+                        # turn (it is searched again on resume)
+                        if event.type != pygame.KEYDOWN:
+                            pass
+                        elif event.key == pygame.K_ESCAPE:
+                            self.cancel_ai_turn()
+                            self.state = 'menu'
+                            self.game_mode = None
+                        elif event.key == pygame.K_SPACE and self.board.ai_vs_ai:
+                            self.cancel_ai_turn()
+                            self.toggle_pause()
+                        elif (event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_MINUS)
+                                and self.board.ai_vs_ai):
+                            self.change_speed(event.key)
+                        else:
+                            self._deferred_keys.append(event)
                     
                     elif event.type == pygame.KEYDOWN:
                         if self.board.game_over:
@@ -269,25 +418,16 @@ class Game:
                             # AI vs AI controls
                             if self.board.ai_vs_ai:
                                 if event.key == pygame.K_SPACE:
-                                    self.paused = not self.paused
-                                    status = "PAUSED" if self.paused else "RESUMED"
-                                    self.message_display = f"Game {status}"
-                                    self.message_timer = 60
-                                elif event.key == pygame.K_EQUALS or event.key == pygame.K_PLUS:
-                                    self.speed_multiplier = min(4.0, self.speed_multiplier * 1.5)
-                                    self.message_display = f"Speed: {self.speed_multiplier:.1f}x"
-                                    self.message_timer = 60
-                                elif event.key == pygame.K_MINUS:
-                                    self.speed_multiplier = max(0.25, self.speed_multiplier / 1.5)
-                                    self.message_display = f"Speed: {self.speed_multiplier:.1f}x"
-                                    self.message_timer = 60
+                                    self.toggle_pause()
+                                elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_MINUS):
+                                    self.change_speed(event.key)
                                 elif event.key == pygame.K_ESCAPE:
                                     self.state = 'menu'
                                     self.game_mode = None
                             
                             # Player vs AI controls
                             else:
-                                if event.key == pygame.K_SPACE and self.board.current_player == 'player':
+                                if event.key == pygame.K_SPACE and self.board.current_player == OWNER_PLAYER:
                                     self.board.end_turn()
                                     self.ai_thinking = True
                                 
@@ -307,42 +447,55 @@ class Game:
                                     self.state = 'menu'
                                     self.game_mode = None
             
-            # Update
-            self.animation.update()
-            if self.message_timer > 0:
-                self.message_timer -= 1
+            if click_pos is not None:
+                if self.state == 'menu':
+                    self.handle_menu_click(click_pos)
+                elif self.state == 'playing' and self._ai_future is None and not self.board.game_over:
+                    # Only allow clicks in Player vs AI mode
+                    if not self.board.ai_vs_ai:
+                        self.handle_board_click(click_pos)
             
-            # AI turn execution
-            if self.board and not self.board.game_over:
-                if self.board.ai_vs_ai:
-                    # AI vs AI mode - both sides are AI
-                    if not self.paused:
-                        self.ai_move_timer -= 1
-                        if self.ai_move_timer <= 0:
-                            # Execute current player's AI turn
-                            self.execute_ai_turn(self.board.current_player)
-                            self.ai_move_timer = int(self.ai_move_delay / self.speed_multiplier)
-                else:
-                    # Player vs AI mode - only execute if it's AI's turn
-                    if self.board.current_player == 'ai' and self.ai_thinking:
-                        self.execute_ai_turn('ai')
+            # Update: one logic step per LOGIC_STEP_MS of elapsed time
+            logic_time += self.clock.tick(FPS)
+            steps = 0
+            while logic_time >= LOGIC_STEP_MS and steps < MAX_LOGIC_STEPS:
+                self.update()
+                logic_time -= LOGIC_STEP_MS
+                steps += 1
+            if steps == MAX_LOGIC_STEPS:
+                logic_time = 0.0  # Too far behind: skip ahead
+            
+            # Render (skipped when nothing visible changed)
+            pulsing = (self.state == 'playing' and self.board.selected_planet is not None)
+            if not (self._dirty or pulsing):
+                continue
+            self._dirty = False
             
-            # Render
             if self.state == 'menu':
-                self.ui.draw_menu()
+                self._menu_rects = self.ui.draw_menu()
                 # Draw mode selection message if any
                 if self.message_display and self.message_timer > 0:
-                    msg_surface = pygame.font.Font(None, 24).render(self.message_display, True, GREEN)
+                    msg_surface = self.ui._text(self._fonts[24], self.message_display, GREEN)
                     msg_rect = msg_surface.get_rect(center=(WINDOW_WIDTH // 2, 350))
                     self.screen.blit(msg_surface, msg_rect)
             elif self.state == 'playing':
-                self.ui.draw_board(self.board, self.animation, self.message_display, 
+                # Overlays are drawn here, on top of the board: when they
+                # change, the board must be redrawn in full underneath
+                overlays = (self.board.ai_vs_ai and self.paused, self.board.game_over)
+                if overlays != self._overlays:
+                    self._overlays = overlays
+                    self.ui.invalidate()
+                
+                dirty_rects = self.ui.draw_board(self.board, self.animation, self.message_display, 
                                   self.message_timer, self.ship_count_input, self.difficulty, self.game_mode)
+                if dirty_rects is not None:
+                    # Partial redraw: overlays are untouched on screen
+                    pygame.display.update(dirty_rects)
+                    continue
                 
                 # Show pause indicator
                 if self.board.ai_vs_ai and self.paused:
-                    pause_font = pygame.font.Font(None, 36)
-                    pause_text = pause_font.render("PAUSED", True, YELLOW)
+                    pause_text = self.ui._text(self._fonts[36], "PAUSED", YELLOW)
                     pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, 50))
                     pygame.draw.rect(self.screen, BLACK, pause_rect.inflate(20, 10))
                     pygame.draw.rect(self.screen, YELLOW, pause_rect.inflate(20, 10), 2)
@@ -352,8 +505,8 @@ class Game:
                     self.ui.draw_game_over(self.board.winner, self.board.ai_vs_ai)
             
             pygame.display.flip()
-            self.clock.tick(60)
         
+        self._executor.shutdown(wait=False, cancel_futures=True)
         pygame.quit()
         sys.exit()
 
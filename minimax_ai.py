@@ -1,9 +1,93 @@
 # minimax_ai.py
 # Minimax AI with Alpha-Beta Pruning
 
+import random
+from collections import Counter
 from fuzzy_logic import FuzzyLogic
 from models import Planet
-from constants import BOARD_SIZE
+from constants import BOARD_SIZE, OWNER_PLAYER, OWNER_AI, OWNER_NEUTRAL, OWNER_NAMES
+
+
+# Strategic center of the board (built once, O(1) membership test)
+_CENTER_POSITIONS = frozenset([(1, 1), (1, 2), (2, 1), (2, 2)])
+
+# Center flag (1/0) per flat board index, so evaluation can sum it directly
+_CENTER_BY_INDEX = tuple(
+    1 if (idx % BOARD_SIZE, idx // BOARD_SIZE) in _CENTER_POSITIONS else 0
+    for idx in range(BOARD_SIZE * BOARD_SIZE)
+)
+
+# Alpha-beta window bounds: every score is an int far inside these, so the
+# search never compares or adds floats
+_INFINITY = 10 ** 9
+
+# Transposition table entry flags
+_EXACT = 0
+_LOWER = 1  # Score is a lower bound (search failed high)
+_UPPER = 2  # Score is an upper bound (search failed low)
+
+# Zobrist keys: one random 64-bit value per (planet idx, owner, ships)
+# state, created on first use. A board's hash is the XOR of its planets'
+# keys, so changing one planet only XORs its old key out and new key in.
+# A private generator keeps the game's global random stream untouched.
+_ZOBRIST_RANDOM = random.Random(0x5EED)
+_ZOBRIST_KEYS = {}
+
+
+def _zobrist_key(planet):
+    """Zobrist key for a planet's current (owner, ships) state"""
+    state = (planet.idx, planet.owner, planet.ships)
+    key = _ZOBRIST_KEYS.get(state)
+    if key is None:
+        key = _ZOBRIST_KEYS[state] = _ZOBRIST_RANDOM.getrandbits(64)
+    return key
+
+
+def hash_board(board):
+    """Full Zobrist hash of a board (XOR of every planet's key)"""
+    zhash = 0
+    for planet in board.planets:
+        zhash ^= _zobrist_key(planet)
+    return zhash
+
+
+def _evaluate_kernel(owner_planets, opponent_planets, production_diff, neutral_count):
+    """
+    Board score from one side's perspective (see MinimaxAI.evaluate_board)
+    
+    Takes only plain lists and ints, no board or AI object, and visits each
+    owned planet once. Scores are in tenths of a point (every weight is
+    scaled by 10), so the search can add a 0-100 aggressiveness percent
+    without rounding it.
+    """
+    owner_count = len(owner_planets)
+    opponent_count = len(opponent_planets)
+
+    # Check terminal states
+    if owner_count == 0:
+        return -100000  # owner lost
+    if opponent_count == 0:
+        return 100000  # owner won
+    if owner_count >= 12:
+        return 100000  # owner won by domination
+    if opponent_count >= 12:
+        return -100000  # opponent won by domination
+
+    # Ship and center control differences in a single pass per side
+    ships = 0
+    center = 0
+    for planet in owner_planets:
+        ships += planet.ships
+        center += _CENTER_BY_INDEX[planet.idx]
+    for planet in opponent_planets:
+        ships -= planet.ships
+        center -= _CENTER_BY_INDEX[planet.idx]
+
+    return ((owner_count - opponent_count) * 1000  # Planet count advantage
+            + ships * 100  # Total ships advantage
+            + production_diff * 500  # Planet size/production advantage
+            + center * 300  # Control of center (strategic positions)
+            + neutral_count * 50)  # Neutral planets available (opportunity)
 
 
 class MinimaxAI:
@@ -22,12 +106,28 @@ class MinimaxAI:
     - Prune branches where beta ≤ alpha
     """
     
-    def __init__(self, board, difficulty='medium', owner='ai'):
+    def __init__(self, board, difficulty='medium', owner=OWNER_AI):
         self.board = board
         self.difficulty = difficulty
         self.fuzzy = FuzzyLogic(board)
-        # Owner this AI controls: 'ai' (red) or 'player' (blue)
+        # Owner this AI controls: OWNER_AI (red) or OWNER_PLAYER (blue)
         self.owner = owner
+        # Transposition table: (zhash, depth, is_maximizing) -> (flag, score, move)
+        self.tt = {}
+        # Best move last found for a position at any depth: (zhash, is_maximizing) -> move
+        self.pv_moves = {}
+        # Closest A* targets per source planet: source idx -> target idxs.
+        # Paths only depend on grid positions, which never change
+        self._closest = {}
+        # Fuzzy results per attack configuration within one search:
+        # (source idx, target idx, player, source ships, target ships,
+        #  target owner) -> (aggressiveness percent, recommended ships)
+        self._fuzzy_cache = {}
+        # Cutoff ordering: the last two moves that caused a cutoff at each
+        # depth, and a score per (source idx, target idx) that grows with
+        # the depth of every cutoff it causes
+        self.killers = [[None, None] for _ in range(8)]
+        self.history = Counter()
         
         # Set search depth based on difficulty
         if difficulty == 'easy':
@@ -40,7 +140,7 @@ class MinimaxAI:
     def evaluate_board(self, board):
         """
         Evaluate board state from AI's perspective
-        Higher score = better for AI
+        Higher score = better for AI (returned in tenths of a point)
         
         Evaluation factors:
         - Planet count (100 points each)
@@ -51,124 +151,132 @@ class MinimaxAI:
         """
         # Evaluate from this AI instance's owner perspective
         owner = self.owner
-        opponent = 'player' if owner == 'ai' else 'ai'
-
-        owner_planets = board.get_player_planets(owner)
-        opponent_planets = board.get_player_planets(opponent)
-
-        # Check terminal states
-        if len(owner_planets) == 0:
-            return -10000  # owner lost
-        if len(opponent_planets) == 0:
-            return 10000  # owner won
-        if len(owner_planets) >= 12:
-            return 10000  # owner won by domination
-        if len(opponent_planets) >= 12:
-            return -10000  # opponent won by domination
-
-        score = 0
-
-        # Planet count advantage
-        score += (len(owner_planets) - len(opponent_planets)) * 100
-
-        # Total ships advantage
-        owner_total_ships = sum(p.ships for p in owner_planets)
-        opponent_total_ships = sum(p.ships for p in opponent_planets)
-        score += (owner_total_ships - opponent_total_ships) * 10
-
-        # Planet size/production advantage
-        owner_production = sum(p.size for p in owner_planets)
-        opponent_production = sum(p.size for p in opponent_planets)
-        score += (owner_production - opponent_production) * 50
-
-        # Control of center (strategic positions)
-        center_positions = [(1, 1), (1, 2), (2, 1), (2, 2)]
-        owner_center = sum(1 for p in owner_planets if p.get_position() in center_positions)
-        opponent_center = sum(1 for p in opponent_planets if p.get_position() in center_positions)
-        score += (owner_center - opponent_center) * 30
-
-        # Neutral planets available (opportunity)
-        neutral_count = len([p for p in board.planets if p.owner is None])
-        score += neutral_count * 5
-
-        return score
+        opponent = OWNER_PLAYER if owner == OWNER_AI else OWNER_AI
+        planets_by_owner = board.planets_by_owner
+        production = board.production_by_owner
+        
+        return _evaluate_kernel(
+            planets_by_owner[owner],
+            planets_by_owner[opponent],
+            production[owner] - production[opponent],
+            len(planets_by_owner[OWNER_NEUTRAL])
+        )
     
-    def get_possible_moves(self, board, player):
+    def get_possible_moves(self, board, player, preferred=None, killers=()):
         """
         Generate all possible moves for a player using fuzzy logic
         
         Process:
         1. For each owned planet with ships
-        2. Find closest targets using A*
-        3. Evaluate each target with fuzzy logic
-        4. Get recommended ship count
-        5. Sort by aggressiveness
+        2. Find closest targets using A* (cached per source planet)
+        3. Evaluate each target with fuzzy logic (quantized to an int
+           percent, 0-100)
+        4. Get recommended ship count (both memoized per configuration)
+        5. Order the moves: the preferred (source idx, target idx, ships)
+           move first if it was generated, then killer moves, cutoff
+           history, and aggressiveness
         """
         moves = []
-        owned_planets = board.get_player_planets(player)
+        planets = board.planets
+        # Moves are generated before any is applied, so the owner's list
+        # can be iterated directly instead of copied
+        owned_planets = board.planets_by_owner[player]
+        fuzzy_cache = self._fuzzy_cache
         
         for source in owned_planets:
             if source.ships <= 1:
                 continue
             
-            # Find potential targets using A*
-            all_targets = [p for p in board.planets if p != source]
-            closest_targets = board.pathfinder.find_closest_planets(source, all_targets, 8)
+            target_indices = self._closest.get(source.idx)
+            if target_indices is None:
+                # Find potential targets using A*
+                all_targets = [p for p in planets if p != source]
+                closest_targets = board.pathfinder.find_closest_planets(source, all_targets, 8)
+                target_indices = [target.idx for target, distance in closest_targets]
+                self._closest[source.idx] = target_indices
             
-            for target, distance in closest_targets:
-                # Use fuzzy logic to evaluate attack
-                aggressiveness = self.fuzzy.evaluate_attack(source, target, player)
-                
-                # Get recommended ship count
-                recommended_ships = self.fuzzy.get_ship_count_recommendation(
-                    source, target, player, aggressiveness
-                )
+            for idx in target_indices:
+                target = planets[idx]
+                key = (source.idx, idx, player, source.ships, target.ships, target.owner)
+                cached = fuzzy_cache.get(key)
+                if cached is None:
+                    # Use fuzzy logic to evaluate the attack
+                    aggressiveness = self.fuzzy.evaluate_attack(source, target, player)
+                    # Get recommended ship count
+                    recommended_ships = self.fuzzy.get_ship_count_recommendation(
+                        source, target, player, aggressiveness
+                    )
+                    aggression = int(aggressiveness * 100 + 0.5)
+                    fuzzy_cache[key] = (aggression, recommended_ships)
+                else:
+                    aggression, recommended_ships = cached
                 
                 if recommended_ships > 0:
-                    moves.append((source, target, recommended_ships, aggressiveness))
+                    moves.append((source, target, recommended_ships, aggression))
         
-        # Sort moves by aggressiveness (higher = more priority)
-        moves.sort(key=lambda x: x[3], reverse=True)
+        # Moves that caused cutoffs elsewhere first, then by aggressiveness
+        # (higher = more priority)
+        history = self.history
+        moves.sort(
+            key=lambda x: ((x[0].idx, x[1].idx, x[2]) in killers,
+                           history[(x[0].idx, x[1].idx)],
+                           x[3]),
+            reverse=True
+        )
+        
+        if preferred is not None:
+            for i, (source, target, ships, _) in enumerate(moves):
+                if (source.idx, target.idx, ships) == preferred:
+                    moves.insert(0, moves.pop(i))
+                    break
         
         return moves
     
-    def simulate_move(self, board, source, target, ships):
+    def make_move(self, board, source, target, ships):
         """
-        Create a new board state after simulating a move
+        Apply a move to board in place (search tree step)
         
-        Returns: new board with move applied
+        Returns: undo record for unmake_move
         """
-        # Deep copy the board
-        new_board = self.copy_board(board)
+        undo = (source.ships, target.ships, target.owner, board.zhash)
         
-        # Find corresponding planets in new board
-        new_source = new_board.grid[source.y][source.x]
-        new_target = new_board.grid[target.y][target.x]
+        # XOR the old source/target states out of the hash
+        zhash = board.zhash ^ _zobrist_key(source) ^ _zobrist_key(target)
         
         # Simulate the attack
-        new_source.remove_ships(ships)
+        source.remove_ships(ships)
         
-        if new_target.owner == new_source.owner:
+        if target.owner == source.owner:
             # Reinforcement
-            new_target.add_ships(ships)
+            target.add_ships(ships)
         else:
             # Attack
-            if ships > new_target.ships:
-                remaining = ships - new_target.ships
-                new_target.owner = new_source.owner
-                new_target.ships = remaining
+            if ships > target.ships:
+                remaining = ships - target.ships
+                board.set_owner(target, source.owner)
+                target.ships = remaining
             else:
-                new_target.remove_ships(ships)
+                target.remove_ships(ships)
         
-        return new_board
+        # XOR the new states back in
+        board.zhash = zhash ^ _zobrist_key(source) ^ _zobrist_key(target)
+        
+        return undo
+    
+    def unmake_move(self, board, source, target, undo):
+        """Restore the state captured by make_move"""
+        source.ships, target.ships, target_owner, board.zhash = undo
+        board.set_owner(target, target_owner)
     
     def copy_board(self, board):
         """Create a deep copy of the board for simulation"""
         from game_board import GameBoard
         
         new_board = GameBoard.__new__(GameBoard)
-        new_board.grid = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
         new_board.planets = []
+        new_board.grid = new_board.planets
+        new_board.planets_by_owner = [[] for _ in OWNER_NAMES]
+        new_board.production_by_owner = list(board.production_by_owner)
         new_board.turn = board.turn
         new_board.current_player = board.current_player
         new_board.selected_planet = None
@@ -176,14 +284,14 @@ class MinimaxAI:
         new_board.winner = None
         
         # Copy planets
-        for y in range(BOARD_SIZE):
-            for x in range(BOARD_SIZE):
-                old_planet = board.grid[y][x]
-                new_planet = Planet(x, y, old_planet.size, old_planet.owner)
-                new_planet.ships = old_planet.ships
-                new_planet.max_ships = old_planet.max_ships
-                new_board.grid[y][x] = new_planet
-                new_board.planets.append(new_planet)
+        for old_planet in board.planets:
+            new_planet = Planet(old_planet.x, old_planet.y, old_planet.size,
+                                old_planet.owner, old_planet.idx)
+            new_planet.ships = old_planet.ships
+            new_planet.max_ships = old_planet.max_ships
+            new_board.planets.append(new_planet)
+            new_board.planets_by_owner[new_planet.owner].append(new_planet)
+        new_board.zhash = hash_board(new_board)
         
         from pathfinding import AStarPathfinder
         new_board.pathfinder = AStarPathfinder(new_board)
@@ -205,19 +313,70 @@ class MinimaxAI:
         1. Base case: depth=0 or game over → evaluate board
         2. Get all possible moves
         3. For each move:
-           - Simulate move
+           - Apply move in place (make_move)
            - Recursively evaluate (depth-1, swap maximizing)
+           - Undo move (unmake_move)
            - Update alpha/beta
            - Prune if beta ≤ alpha
         4. Return best score and move
+        
+        Transposition table: positions already searched to the same depth
+        (reached through a different move order) reuse the stored score,
+        or tighten alpha/beta when only a bound is known.
         """
+        key = (board.zhash, depth, is_maximizing)
+        # The stored flag is relative to the caller's window, before any
+        # tightening from the table
+        orig_alpha, orig_beta = alpha, beta
+        entry = self.tt.get(key)
+        if entry is not None:
+            flag, score, move = entry
+            if flag == _EXACT:
+                return score, self._move_on(board, move)
+            if flag == _LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if beta <= alpha:
+                return score, self._move_on(board, move)
+        
+        score, best_move = self._search(board, depth, alpha, beta, is_maximizing)
+        
+        if score <= orig_alpha:
+            flag = _UPPER
+        elif score >= orig_beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        move = None
+        if best_move is not None:
+            source, target, ships = best_move
+            move = (source.idx, target.idx, ships)
+        self.tt[key] = (flag, score, move)
+        if move is not None:
+            self.pv_moves[(board.zhash, is_maximizing)] = move
+        
+        return score, best_move
+    
+    def _move_on(self, board, move):
+        """Map a stored (source idx, target idx, ships) move onto board's planets"""
+        if move is None:
+            return None
+        source_idx, target_idx, ships = move
+        return (board.planets[source_idx], board.planets[target_idx], ships)
+    
+    def _search(self, board, depth, alpha, beta, is_maximizing):
+        """Alpha-beta search body behind minimax (no transposition lookup)"""
         # Terminal state or max depth reached
         if depth == 0 or board.game_over:
             return self.evaluate_board(board), None
 
         # Determine which side is the maximizing side for this AI instance
-        current_player = self.owner if is_maximizing else ('player' if self.owner == 'ai' else 'ai')
-        possible_moves = self.get_possible_moves(board, current_player)
+        current_player = self.owner if is_maximizing else (OWNER_PLAYER if self.owner == OWNER_AI else OWNER_AI)
+        # Search the best move from a shallower iteration first
+        preferred = self.pv_moves.get((board.zhash, is_maximizing))
+        possible_moves = self.get_possible_moves(board, current_player, preferred,
+                                                 self.killers[depth])
 
         # No moves available
         if not possible_moves:
@@ -227,16 +386,20 @@ class MinimaxAI:
 
         if is_maximizing:
             # Owner's turn - maximize score
-            max_eval = float('-inf')
+            max_eval = -_INFINITY
 
             for move in possible_moves:
-                source, target, ships, aggressiveness = move
-                new_board = self.simulate_move(board, source, target, ships)
-
-                eval_score, _ = self.minimax(new_board, depth - 1, alpha, beta, False)
-
-                # Bonus for higher aggressiveness (encourages decisive play)
-                eval_score += aggressiveness * 10
+                source, target, ships, aggression = move
+                # Bonus for higher aggressiveness (encourages decisive play):
+                # 0-10 points, i.e. the 0-100 percent in the board's tenths.
+                # It is added after the reply is searched, so the reply's
+                # window is shifted down by it: a bound returned for the
+                # reply stays a bound once the bonus is added
+                bonus = aggression
+                undo = self.make_move(board, source, target, ships)
+                eval_score, _ = self.minimax(board, depth - 1, alpha - bonus, beta - bonus, False)
+                self.unmake_move(board, source, target, undo)
+                eval_score += bonus
 
                 if eval_score > max_eval:
                     max_eval = eval_score
@@ -244,19 +407,20 @@ class MinimaxAI:
 
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
+                    self._record_cutoff(source, target, ships, depth)
                     break  # Beta cutoff
 
             return max_eval, best_move
 
         else:
             # Opponent's turn - minimize score
-            min_eval = float('inf')
+            min_eval = _INFINITY
 
             for move in possible_moves:
-                source, target, ships, aggressiveness = move
-                new_board = self.simulate_move(board, source, target, ships)
-
-                eval_score, _ = self.minimax(new_board, depth - 1, alpha, beta, True)
+                source, target, ships, aggression = move
+                undo = self.make_move(board, source, target, ships)
+                eval_score, _ = self.minimax(board, depth - 1, alpha, beta, True)
+                self.unmake_move(board, source, target, undo)
 
                 if eval_score < min_eval:
                     min_eval = eval_score
@@ -264,21 +428,53 @@ class MinimaxAI:
 
                 beta = min(beta, eval_score)
                 if beta <= alpha:
+                    self._record_cutoff(source, target, ships, depth)
                     break  # Alpha cutoff
 
             return min_eval, best_move
     
-    def get_best_move(self):
+    def _record_cutoff(self, source, target, ships, depth):
+        """Remember a move that caused a cutoff, for killer/history ordering"""
+        move = (source.idx, target.idx, ships)
+        killers = self.killers[depth]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        self.history[(source.idx, target.idx)] += depth * depth
+    
+    def get_best_move(self, board=None):
         """
         Get the best move for AI using minimax
         
-        Returns: (source_planet, target_planet, ship_count)
+        board defaults to the game board; pass a copy_board snapshot to
+        search without touching the live board (e.g. from another thread).
+        
+        Iterative deepening: searches depth 1, 2, ... max_depth. Each
+        iteration stores its best moves in pv_moves, so the next, deeper
+        iteration searches the likely-best branch first and prunes more.
+        
+        Returns: (source_planet, target_planet, ship_count), with planets
+        taken from the searched board
         """
-        score, best_move = self.minimax(
-            self.board, 
-            self.max_depth, 
-            float('-inf'),  # Initial alpha
-            float('inf'),   # Initial beta
-            True  # AI is maximizing
-        )
+        if board is None:
+            board = self.board
+        
+        # Scores depend on the current turn, so entries never carry over
+        self.tt.clear()
+        self.pv_moves.clear()
+        self._fuzzy_cache.clear()
+        self.history.clear()
+        for killers in self.killers:
+            killers[0] = killers[1] = None
+        board.zhash = hash_board(board)
+        
+        best_move = None
+        for depth in range(1, self.max_depth + 1):
+            score, best_move = self.minimax(
+                board, 
+                depth, 
+                -_INFINITY,  # Initial alpha
+                _INFINITY,   # Initial beta
+                True  # AI is maximizing
+            )
         return best_move
\ No newline at end of file
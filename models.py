@@ -1,14 +1,21 @@
 # models.py
 # Core game models and data structures
 
+from constants import OWNER_NEUTRAL, OWNER_NAMES
+
+
 class Planet:
     """Represents a planet on the game board"""
     
-    def __init__(self, x, y, size, owner=None):
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = ('x', 'y', 'idx', 'size', 'owner', 'ships', 'max_ships')
+    
+    def __init__(self, x, y, size, owner=OWNER_NEUTRAL, idx=0):
         self.x = x  # Grid position
         self.y = y  # Grid position
+        self.idx = idx  # Flat board index (y * BOARD_SIZE + x)
         self.size = size  # 1, 2, or 3 (determines production rate)
-        self.owner = owner  # None, 'player', or 'ai'
+        self.owner = owner  # OWNER_NEUTRAL, OWNER_PLAYER or OWNER_AI
         self.ships = 0
         self.max_ships = size * 3  # Capacity based on size
         
@@ -23,11 +30,6 @@ class Planet:
     def remove_ships(self, count):
         """Remove ships, minimum 0"""
         self.ships = max(0, self.ships - count)
-        
-    def generate_ships(self):
-        """Generate 1 ship per turn if owned"""
-        if self.owner in ['player', 'ai']:
-            self.add_ships(1)
     
     def __repr__(self):
-        return f"Planet({self.x},{self.y},size={self.size},owner={self.owner},ships={self.ships})"
\ No newline at end of file
+        return f"Planet({self.x},{self.y},size={self.size},owner={OWNER_NAMES[self.owner]},ships={self.ships})"
\ No newline at end of file
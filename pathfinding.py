@@ -3,7 +3,46 @@
 
 import heapq
 from math import sqrt
-from constants import BOARD_SIZE
+from constants import BOARD_SIZE, OWNER_NEUTRAL
+
+
+# Octile distance: a diagonal step (cost sqrt(2)) replaces two straight
+# steps (cost 2), saving sqrt(2) - 2 per diagonal
+SQRT2_MINUS_2 = sqrt(2) - 2
+
+# The 8 neighbor offsets with their step costs (1 straight, sqrt(2) diagonal)
+_NEIGHBOR_OFFSETS = tuple(
+    (dx, dy, sqrt(dx * dx + dy * dy))
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    if dx or dy
+)
+
+# Flat node ids (y * BOARD_SIZE + x, as in GameBoard.grid) used by find_path:
+# the position of each id, and each id's in-bounds neighbors as
+# (neighbor id, step cost) in _NEIGHBOR_OFFSETS order
+_ID_POSITIONS = tuple((i % BOARD_SIZE, i // BOARD_SIZE) for i in range(BOARD_SIZE * BOARD_SIZE))
+_NEIGHBOR_IDS = tuple(
+    tuple(
+        ((y + dy) * BOARD_SIZE + x + dx, step)
+        for dx, dy, step in _NEIGHBOR_OFFSETS
+        if 0 <= x + dx < BOARD_SIZE and 0 <= y + dy < BOARD_SIZE
+    )
+    for x, y in _ID_POSITIONS
+)
+
+
+def _walk_parents(came_from, pos):
+    """
+    Follow parent links from pos until a position without a parent
+    
+    Returns: list of positions, starting with pos
+    """
+    chain = [pos]
+    while pos in came_from:
+        pos = came_from[pos]
+        chain.append(pos)
+    return chain
 
 
 class AStarPathfinder:
@@ -13,24 +52,40 @@ class AStarPathfinder:
         self.board = board
     
     def heuristic(self, pos1, pos2):
-        """Manhattan distance heuristic - admissible and consistent"""
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+        """
+        Octile distance heuristic - exact on an open 8-connected grid with
+        unit straight and sqrt(2) diagonal steps, so admissible and consistent
+        """
+        return self.grid_distance(pos1, pos2)
+    
+    def grid_distance(self, pos1, pos2):
+        """Closed-form octile distance between two grid positions"""
+        dx = abs(pos1[0] - pos2[0])
+        dy = abs(pos1[1] - pos2[1])
+        return (dx + dy) + SQRT2_MINUS_2 * min(dx, dy)
     
     def euclidean_distance(self, pos1, pos2):
         """Euclidean distance for accurate movement cost"""
         return sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
     
     def get_neighbors(self, pos):
-        """Get all valid neighbor positions (8-directional movement)"""
+        """
+        Get all valid neighbors (8-directional movement)
+        
+        Returns: list of (nx, ny, step_cost), with the euclidean step cost
+        precomputed
+        """
         x, y = pos
+        # Interior cells: all 8 neighbors are on the board, no bounds checks
+        if 0 < x < BOARD_SIZE - 1 and 0 < y < BOARD_SIZE - 1:
+            return [(x + dx, y + dy, step) for dx, dy, step in _NEIGHBOR_OFFSETS]
+        
         neighbors = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE:
-                    neighbors.append((nx, ny))
+        for dx, dy, step in _NEIGHBOR_OFFSETS:
+            nx = x + dx
+            ny = y + dy
+            if 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE:
+                neighbors.append((nx, ny, step))
         return neighbors
     
     def find_path(self, start_pos, end_pos):
@@ -42,68 +97,175 @@ class AStarPathfinder:
         Algorithm steps:
         1. Initialize open set with start position
         2. While open set not empty:
-           - Pop position with lowest f_score
-           - If reached goal, return path
+           - Pop position with lowest f_score (skipping stale entries)
+           - If reached goal, rebuild path from came_from and return it
            - Explore neighbors
            - Calculate g_score (cost from start)
            - Calculate f_score (g + heuristic)
-           - Add to open set if better path found
+           - Add to open set (and record parent) if better path found
         """
         if start_pos == end_pos:
             return [start_pos], 0
         
-        # Priority queue: (f_score, counter, position, g_score, path)
+        # Positions are searched as flat ids (see _NEIGHBOR_IDS), so g-scores
+        # and parents live in lists instead of tuple-keyed dicts
+        end_x, end_y = end_pos
+        start_id = start_pos[1] * BOARD_SIZE + start_pos[0]
+        end_id = end_y * BOARD_SIZE + end_x
+        
+        # Priority queue: (f_score, counter, g_score, id). Paths are not
+        # stored per entry: each id records the neighbor it was best reached
+        # from, and the path is rebuilt once the goal is popped
         counter = 0
-        start_g = 0
-        start_f = start_g + self.heuristic(start_pos, end_pos)
-        open_set = [(start_f, counter, start_pos, start_g, [start_pos])]
-        closed_set = set()
+        start_f = self.heuristic(start_pos, end_pos)
+        open_set = [(start_f, counter, 0, start_id)]
+        best_g = [float('inf')] * (BOARD_SIZE * BOARD_SIZE)
+        best_g[start_id] = 0
+        came_from = {}
+        # The last entry produced by an expansion is held back and merged
+        # into the next pop with heappushpop (one sift instead of two)
+        pending = None
         
-        while open_set:
-            f_score, _, current_pos, g_score, path = heapq.heappop(open_set)
+        while open_set or pending is not None:
+            if pending is None:
+                entry = heapq.heappop(open_set)
+            else:
+                entry = heapq.heappushpop(open_set, pending)
+                pending = None
+            f_score, _, g_score, current_id = entry
             
-            if current_pos in closed_set:
-                continue
+            if g_score > best_g[current_id]:
+                continue  # Stale entry, position was reached more cheaply since
             
-            if current_pos == end_pos:
+            if current_id == end_id:
+                path = [_ID_POSITIONS[i] for i in _walk_parents(came_from, current_id)]
+                path.reverse()
                 return path, g_score
             
-            closed_set.add(current_pos)
-            
-            for neighbor in self.get_neighbors(current_pos):
-                if neighbor in closed_set:
-                    continue
-                
-                # Calculate movement cost (euclidean distance)
-                move_cost = self.euclidean_distance(current_pos, neighbor)
+            for neighbor, move_cost in _NEIGHBOR_IDS[current_id]:
+                # Movement cost (euclidean distance) comes precomputed
                 new_g = g_score + move_cost
-                new_f = new_g + self.heuristic(neighbor, end_pos)
-                new_path = path + [neighbor]
                 
+                # Only a strictly better route is recorded. The heuristic is
+                # consistent, so expanded positions never improve and no
+                # closed set is needed
+                if new_g >= best_g[neighbor]:
+                    continue
+                best_g[neighbor] = new_g
+                came_from[neighbor] = current_id
+                # Octile heuristic (see grid_distance), inlined
+                nx, ny = _ID_POSITIONS[neighbor]
+                dx = abs(nx - end_x)
+                dy = abs(ny - end_y)
+                new_f = new_g + (dx + dy) + SQRT2_MINUS_2 * (dx if dx < dy else dy)
                 counter += 1
-                heapq.heappush(open_set, (new_f, counter, neighbor, new_g, new_path))
+                if pending is not None:
+                    heapq.heappush(open_set, pending)
+                pending = (new_f, counter, new_g, neighbor)
         
         # No path found (shouldn't happen on full grid)
         return [], float('inf')
     
+    def find_path_bidirectional(self, start_pos, end_pos):
+        """
+        Bidirectional A*: search forward from start and backward from end
+        at the same time, meeting in the middle
+        
+        Returns: (path, cost), same as find_path
+        
+        Algorithm steps:
+        1. Open sets for both directions (side 0 forward, side 1 backward)
+        2. While both open sets are non-empty:
+           - Stop once either side's lowest f_score reaches the best
+             meeting cost found (no shorter path can remain)
+           - Expand the smaller frontier, as in find_path
+           - When a position reached by both sides gives a cheaper
+             start-to-end cost, remember it as the meeting point
+        3. Join the two parent chains at the meeting point
+        """
+        if start_pos == end_pos:
+            return [start_pos], 0
+        
+        heuristic = self.heuristic
+        goals = (end_pos, start_pos)
+        open_sets = (
+            [(heuristic(start_pos, end_pos), 0, 0, start_pos)],
+            [(heuristic(end_pos, start_pos), 0, 0, end_pos)],
+        )
+        best_g = ({start_pos: 0}, {end_pos: 0})
+        came_from = ({}, {})
+        counter = 0
+        best_cost = float('inf')
+        meeting_pos = None
+        
+        while open_sets[0] and open_sets[1]:
+            if open_sets[0][0][0] >= best_cost or open_sets[1][0][0] >= best_cost:
+                break
+            
+            side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+            open_set = open_sets[side]
+            side_g = best_g[side]
+            other_g = best_g[1 - side]
+            parents = came_from[side]
+            goal = goals[side]
+            
+            f_score, _, g_score, current_pos = heapq.heappop(open_set)
+            if g_score > side_g[current_pos]:
+                continue  # Stale entry
+            
+            for nx, ny, move_cost in self.get_neighbors(current_pos):
+                neighbor = (nx, ny)
+                new_g = g_score + move_cost
+                if new_g >= side_g.get(neighbor, float('inf')):
+                    continue
+                side_g[neighbor] = new_g
+                parents[neighbor] = current_pos
+                counter += 1
+                heapq.heappush(open_set, (new_g + heuristic(neighbor, goal), counter, new_g, neighbor))
+                
+                # Reached from the other side too: candidate meeting point
+                if neighbor in other_g and new_g + other_g[neighbor] < best_cost:
+                    best_cost = new_g + other_g[neighbor]
+                    meeting_pos = neighbor
+        
+        if meeting_pos is None:
+            # No path found (shouldn't happen on full grid)
+            return [], float('inf')
+        
+        # Forward chain back to start (reversed), then backward chain to end
+        path = _walk_parents(came_from[0], meeting_pos)
+        path.reverse()
+        path.extend(_walk_parents(came_from[1], meeting_pos)[1:])
+        return path, best_cost
+    
     def get_distance(self, planet1, planet2):
-        """Get A* distance between two planets"""
-        path, cost = self.find_path(planet1.get_position(), planet2.get_position())
-        return cost
+        """
+        Get shortest-path distance between two planets
+        
+        The grid has no obstacles, so the A* path cost always equals the
+        octile distance: use the closed form (find_path is only needed
+        when the path itself is wanted).
+        """
+        return self.grid_distance(planet1.get_position(), planet2.get_position())
     
     def find_closest_planets(self, source_planet, target_planets, max_count=5):
         """
-        Find closest planets to source using A*
+        Find closest planets to source (by A* path distance)
         Returns: List of (planet, distance) sorted by distance
         """
+        # Octile distance (see grid_distance) inlined over all targets, with
+        # the source position looked up once
+        source_x, source_y = source_planet.get_position()
         distances = []
         for target in target_planets:
             if target != source_planet:
-                dist = self.get_distance(source_planet, target)
-                distances.append((target, dist))
+                dx = abs(target.x - source_x)
+                dy = abs(target.y - source_y)
+                distances.append((target, (dx + dy) + SQRT2_MINUS_2 * (dx if dx < dy else dy)))
         
-        distances.sort(key=lambda x: x[1])
-        return distances[:max_count]
+        # Only the max_count closest are needed: partial selection instead of
+        # a full sort (ties keep board order, as with a stable sort)
+        return heapq.nsmallest(max_count, distances, key=lambda x: x[1])
     
     def get_strategic_distance(self, planet1, planet2, owner):
         """
@@ -121,7 +283,7 @@ class AStarPathfinder:
         if planet2.owner == owner:
             # Reinforcing own planet - lower priority
             strategic_distance = base_distance * 1.5
-        elif planet2.owner is None:
+        elif planet2.owner == OWNER_NEUTRAL:
             # Neutral planet - valuable for expansion
             strategic_distance = base_distance / (target_value + 1)
         else:
@@ -5,6 +5,37 @@ import pygame
 from constants import *
 
 
+# Control instructions per game mode
+PVAI_INSTRUCTIONS = (
+    "• Click planet to select",
+    "• Click target to choose",
+    "• Type ships to send",
+    "• ENTER to confirm attack",
+    "• SPACE to end turn",
+    "• F for fuzzy analysis"
+)
+AIVAI_INSTRUCTIONS = (
+    "• Watch AI agents battle!",
+    "• SPACE to pause/resume",
+    "• + to speed up",
+    "• - to slow down",
+    "• R to restart",
+    "• ESC for menu"
+)
+
+# Most rendered text surfaces kept (least recently used are dropped first):
+# typed ship counts, messages and ship numbers would otherwise pile up
+_TEXT_CACHE_SIZE = 256
+
+# Planet color and selected-planet owner label, indexed by owner code
+# (OWNER_NEUTRAL, OWNER_PLAYER, OWNER_AI)
+_OWNER_COLOR = (LIGHT_GRAY, BLUE, RED)
+_OWNER_LABEL = (("Neutral", LIGHT_GRAY), ("Player", BLUE), ("AI", RED))
+
+# Planet outline color: each planet color darkened by 50 per channel
+_DARKER = {color: tuple(max(0, c - 50) for c in color) for color in (LIGHT_GRAY, BLUE, RED)}
+
+
 class UIRenderer:
     """Handles all UI rendering"""
     
@@ -13,75 +44,151 @@ class UIRenderer:
         self.font = pygame.font.Font(None, 28)
         self.large_font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 22)
+        
+        # Rendered text surfaces: (font id, text, color) -> Surface, in least
+        # to most recently used order. Labels rarely change, so most frames
+        # only blit cached surfaces
+        self._text_cache = {}
+        
+        # Everything draw_board showed at its last full redraw (None: the
+        # screen holds something else, e.g. the menu)
+        self._prev_state = None
+        
+        # Static screens and panels, composed once and blitted per frame
+        self._menu_surface, self._menu_rects = self._build_menu()
+        self._controls_surfaces = {
+            False: self._build_controls(PVAI_INSTRUCTIONS),
+            True: self._build_controls(AIVAI_INSTRUCTIONS),
+        }
+        self._grid_surface = self._build_grid()
+        self._status_box = self._build_status_box()
+        # One cell-sized sprite per (owner, size): shadow, planet, outline,
+        # size digit and (for owned planets) the ship count badge
+        self._planet_sprites = {
+            (owner, size): self._build_planet_sprite(owner, size)
+            for owner in range(len(OWNER_NAMES))
+            for size in (1, 2, 3)
+        }
+    
+    def _text(self, font, text, color):
+        """Rendered (antialiased) surface for text, built on first use"""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            surface = font.render(text, True, color)
+            if len(cache) >= _TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]  # Least recently used
+        cache[key] = surface  # (Re)inserted as most recently used
+        return surface
     
     def draw_menu(self):
-        """Draw main menu screen"""
-        self.screen.fill(BLACK)
+        """Draw main menu screen (blits the pre-rendered menu)"""
+        self.invalidate()
+        self.screen.blit(self._menu_surface, (0, 0))
+        return self._menu_rects
+    
+    def _build_menu(self):
+        """
+        Render the static menu once
+        
+        Returns: (surface, (pvai_rect, aivai_rect, easy_rect, medium_rect, hard_rect))
+        """
+        surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        surface.fill(BLACK)
         
-        title = self.large_font.render("GRAVITON", True, YELLOW)
+        title = self._text(self.large_font, "GRAVITON", YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # Mode selection
-        mode_title = self.font.render("Select Game Mode:", True, WHITE)
+        mode_title = self._text(self.font, "Select Game Mode:", WHITE)
         mode_rect = mode_title.get_rect(center=(WINDOW_WIDTH // 2, 180))
-        self.screen.blit(mode_title, mode_rect)
+        surface.blit(mode_title, mode_rect)
         
         # Player vs AI button
         pvai_rect = pygame.Rect(WINDOW_WIDTH // 2 - 150, 220, 300, 50)
-        pygame.draw.rect(self.screen, BLUE, pvai_rect)
-        pygame.draw.rect(self.screen, WHITE, pvai_rect, 2)
-        pvai_text = self.font.render("PLAYER vs AI", True, WHITE)
-        self.screen.blit(pvai_text, pvai_text.get_rect(center=pvai_rect.center))
+        pygame.draw.rect(surface, BLUE, pvai_rect)
+        pygame.draw.rect(surface, WHITE, pvai_rect, 2)
+        pvai_text = self._text(self.font, "PLAYER vs AI", WHITE)
+        surface.blit(pvai_text, pvai_text.get_rect(center=pvai_rect.center))
         
         # AI vs AI button
         aivai_rect = pygame.Rect(WINDOW_WIDTH // 2 - 150, 290, 300, 50)
-        pygame.draw.rect(self.screen, PURPLE, aivai_rect)
-        pygame.draw.rect(self.screen, WHITE, aivai_rect, 2)
-        aivai_text = self.font.render("AI vs AI (Watch)", True, WHITE)
-        self.screen.blit(aivai_text, aivai_text.get_rect(center=aivai_rect.center))
+        pygame.draw.rect(surface, PURPLE, aivai_rect)
+        pygame.draw.rect(surface, WHITE, aivai_rect, 2)
+        aivai_text = self._text(self.font, "AI vs AI (Watch)", WHITE)
+        surface.blit(aivai_text, aivai_text.get_rect(center=aivai_rect.center))
         
-        subtitle = self.font.render("Select Difficulty:", True, WHITE)
+        subtitle = self._text(self.font, "Select Difficulty:", WHITE)
         subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 370))
-        self.screen.blit(subtitle, subtitle_rect)
+        surface.blit(subtitle, subtitle_rect)
         
         # Difficulty buttons
         easy_rect = pygame.Rect(WINDOW_WIDTH // 2 - 100, 420, 200, 60)
         medium_rect = pygame.Rect(WINDOW_WIDTH // 2 - 100, 500, 200, 60)
         hard_rect = pygame.Rect(WINDOW_WIDTH // 2 - 100, 580, 200, 60)
         
-        pygame.draw.rect(self.screen, GREEN, easy_rect)
-        pygame.draw.rect(self.screen, YELLOW, medium_rect)
-        pygame.draw.rect(self.screen, RED, hard_rect)
+        pygame.draw.rect(surface, GREEN, easy_rect)
+        pygame.draw.rect(surface, YELLOW, medium_rect)
+        pygame.draw.rect(surface, RED, hard_rect)
         
-        easy_text = self.font.render("EASY", True, BLACK)
-        medium_text = self.font.render("MEDIUM", True, BLACK)
-        hard_text = self.font.render("HARD", True, BLACK)
+        easy_text = self._text(self.font, "EASY", BLACK)
+        medium_text = self._text(self.font, "MEDIUM", BLACK)
+        hard_text = self._text(self.font, "HARD", BLACK)
         
-        self.screen.blit(easy_text, easy_text.get_rect(center=easy_rect.center))
-        self.screen.blit(medium_text, medium_text.get_rect(center=medium_rect.center))
-        self.screen.blit(hard_text, hard_text.get_rect(center=hard_rect.center))
+        surface.blit(easy_text, easy_text.get_rect(center=easy_rect.center))
+        surface.blit(medium_text, medium_text.get_rect(center=medium_rect.center))
+        surface.blit(hard_text, hard_text.get_rect(center=hard_rect.center))
         
-        return pvai_rect, aivai_rect, easy_rect, medium_rect, hard_rect
+        return surface, (pvai_rect, aivai_rect, easy_rect, medium_rect, hard_rect)
+    
+    def invalidate(self):
+        """Force the next draw_board to redraw the whole screen"""
+        self._prev_state = None
     
     def draw_board(self, board, animation, message_display, message_timer, ship_count_input, difficulty, game_mode="pvai"):
-        """Draw game board with all UI elements"""
+        """
+        Draw game board with all UI elements
+        
+        Dirty-rect rendering: when nothing drawn has changed since the last
+        full redraw (planets, turn, selection, message, input, animations),
+        only the pulsing selected cell is repainted.
+        
+        Returns: None after a full redraw, otherwise the list of screen
+        rects that were repainted (for pygame.display.update)
+        """
+        selected = board.selected_planet
+        message = message_display if message_display and message_timer > 0 else None
+        state = (
+            id(board), board.turn, board.current_player,
+            tuple((planet.owner, planet.ships) for planet in board.planets),
+            selected.idx if selected else None,
+            message, ship_count_input, difficulty, game_mode,
+            animation.is_playing(),
+        )
+        if state == self._prev_state and not animation.is_playing():
+            if selected is None:
+                return []
+            return [self._draw_cell(selected, self._pulse(), clear=True)]
+        self._prev_state = state
+        
         self.screen.fill(BLACK)
         
         # Draw title
         if board.ai_vs_ai:
-            title_text = f"Turn {board.turn // 2 + 1} - AI {board.current_player.upper()}'s Turn"
-            title_color = BLUE if board.current_player == 'player' else RED
+            title_text = f"Turn {board.turn // 2 + 1} - AI {OWNER_NAMES[board.current_player].upper()}'s Turn"
+            title_color = BLUE if board.current_player == OWNER_PLAYER else RED
         else:
-            title_text = f"Turn {board.turn // 2 + 1} - {board.current_player.upper()}'s Turn"
-            title_color = BLUE if board.current_player == 'player' else RED
+            title_text = f"Turn {board.turn // 2 + 1} - {OWNER_NAMES[board.current_player].upper()}'s Turn"
+            title_color = BLUE if board.current_player == OWNER_PLAYER else RED
         
-        title = self.font.render(title_text, True, title_color)
+        title = self._text(self.font, title_text, title_color)
         self.screen.blit(title, (BOARD_OFFSET_X, 20))
         
         # Show game mode and difficulty
         mode_text = "AI vs AI" if board.ai_vs_ai else "Player vs AI"
-        diff_text = self.small_font.render(f"{mode_text} | Difficulty: {difficulty.upper()}", True, YELLOW)
+        diff_text = self._text(self.small_font, f"{mode_text} | Difficulty: {difficulty.upper()}", YELLOW)
         self.screen.blit(diff_text, (BOARD_OFFSET_X, 55))
         
         # Draw grid and planets
@@ -94,92 +201,137 @@ class UIRenderer:
         self._draw_info_panel(board, ship_count_input)
         
         # Draw status message
-        if message_display and message_timer > 0:
-            self._draw_message(message_display)
+        if message:
+            self._draw_message(message)
     
-    def _draw_planets(self, board):
-        """Draw all planets on the board"""
+    def _build_grid(self):
+        """Render the empty board (black cells with their borders) once"""
+        surface = pygame.Surface((BOARD_SIZE * CELL_SIZE, BOARD_SIZE * CELL_SIZE))
+        surface.fill(BLACK)
         for y in range(BOARD_SIZE):
             for x in range(BOARD_SIZE):
-                planet = board.grid[y][x]
-                screen_x = BOARD_OFFSET_X + x * CELL_SIZE
-                screen_y = BOARD_OFFSET_Y + y * CELL_SIZE
-                
-                # Draw cell border
-                pygame.draw.rect(self.screen, (50, 50, 50), 
-                               (screen_x, screen_y, CELL_SIZE, CELL_SIZE), 1)
-                
-                # Planet color based on owner
-                color = LIGHT_GRAY
-                if planet.owner == 'player':
-                    color = BLUE
-                elif planet.owner == 'ai':
-                    color = RED
-                
-                radius = 15 + planet.size * 8
-                center = (screen_x + CELL_SIZE // 2, screen_y + CELL_SIZE // 2)
-                
-                # Highlight selected planet with pulsing effect
-                if planet == board.selected_planet:
-                    pulse = abs(pygame.time.get_ticks() % 1000 - 500) / 500
-                    glow_radius = radius + 5 + int(pulse * 5)
-                    pygame.draw.circle(self.screen, YELLOW, center, glow_radius, 3)
-                
-                # Draw planet shadow
-                shadow_offset = 3
-                pygame.draw.circle(self.screen, (30, 30, 30), 
-                                 (center[0] + shadow_offset, center[1] + shadow_offset), radius)
-                
-                # Draw planet
-                pygame.draw.circle(self.screen, color, center, radius)
-                pygame.draw.circle(self.screen, tuple(max(0, c - 50) for c in color), center, radius, 2)
-                
-                # Draw size
-                size_text = self.small_font.render(str(planet.size), True, BLACK)
-                size_rect = size_text.get_rect(center=(center[0], center[1] - 5))
-                self.screen.blit(size_text, size_rect)
-                
-                # Draw ship count
-                if planet.owner:
-                    pygame.draw.circle(self.screen, BLACK, (center[0], center[1] + 10), 15)
-                    ship_text = self.small_font.render(str(planet.ships), True, WHITE)
-                    ship_rect = ship_text.get_rect(center=(center[0], center[1] + 10))
-                    self.screen.blit(ship_text, ship_rect)
+                pygame.draw.rect(surface, (50, 50, 50), (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+        return surface
+    
+    def _build_status_box(self):
+        """Render the game status box background and title once"""
+        surface = pygame.Surface((380, 150))
+        surface.fill((30, 30, 30))
+        pygame.draw.rect(surface, YELLOW, surface.get_rect(), 2)
+        surface.blit(self._text(self.font, "GAME STATUS", YELLOW), (10, 10))
+        return surface
+    
+    def _draw_planets(self, board):
+        """Draw all planets on the board"""
+        self.screen.blit(self._grid_surface, (BOARD_OFFSET_X, BOARD_OFFSET_Y))
+        selected = board.selected_planet
+        # Only the selected planet glows: its pulse is computed once per frame
+        pulse = self._pulse() if selected else None
+        for planet in board.grid:
+            self._draw_cell(planet, pulse if planet == selected else None)
+    
+    def _pulse(self):
+        """Selection glow phase (0.0 to 1.0), cycling once per second"""
+        return abs(pygame.time.get_ticks() % 1000 - 500) / 500
+    
+    def _draw_cell(self, planet, pulse=None, clear=False):
+        """
+        Draw one grid cell with its planet (pulse: glow phase if selected;
+        clear=True paints the cell background first, for a partial redraw)
+        
+        Returns: the cell's screen rect
+        """
+        x, y = planet.get_position()
+        screen_x = BOARD_OFFSET_X + x * CELL_SIZE
+        screen_y = BOARD_OFFSET_Y + y * CELL_SIZE
+        cell_rect = pygame.Rect(screen_x, screen_y, CELL_SIZE, CELL_SIZE)
+        
+        # Empty cell and border come from the grid surface blitted by
+        # _draw_planets; a partial redraw restores just this cell from it
+        if clear:
+            self.screen.blit(self._grid_surface, cell_rect,
+                             cell_rect.move(-BOARD_OFFSET_X, -BOARD_OFFSET_Y))
+        
+        radius = 15 + planet.size * 8
+        center = (screen_x + CELL_SIZE // 2, screen_y + CELL_SIZE // 2)
+        
+        # Highlight selected planet with pulsing effect (drawn under the
+        # planet and its shadow)
+        if pulse is not None:
+            glow_radius = radius + 5 + int(pulse * 5)
+            pygame.draw.circle(self.screen, YELLOW, center, glow_radius, 3)
+        
+        # Draw planet (pre-rendered)
+        self.screen.blit(self._planet_sprites[(planet.owner, planet.size)], (screen_x, screen_y))
+        
+        # Draw ship count
+        if planet.owner:
+            ship_text = self._text(self.small_font, str(planet.ships), WHITE)
+            ship_rect = ship_text.get_rect(center=(center[0], center[1] + 10))
+            self.screen.blit(ship_text, ship_rect)
+        
+        return cell_rect
+    
+    def _build_planet_sprite(self, owner, size):
+        """Render a planet as a transparent CELL_SIZE square, centered"""
+        sprite = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+        
+        # Planet color based on owner
+        color = _OWNER_COLOR[owner]
+        
+        radius = 15 + size * 8
+        center = (CELL_SIZE // 2, CELL_SIZE // 2)
+        
+        # Planet shadow
+        shadow_offset = 3
+        pygame.draw.circle(sprite, (30, 30, 30), 
+                         (center[0] + shadow_offset, center[1] + shadow_offset), radius)
+        
+        # Planet
+        pygame.draw.circle(sprite, color, center, radius)
+        pygame.draw.circle(sprite, _DARKER[color], center, radius, 2)
+        
+        # Size
+        size_text = self._text(self.small_font, str(size), BLACK)
+        size_rect = size_text.get_rect(center=(center[0], center[1] - 5))
+        sprite.blit(size_text, size_rect)
+        
+        # Ship count badge (the count itself is drawn per frame)
+        if owner:
+            pygame.draw.circle(sprite, BLACK, (center[0], center[1] + 10), 15)
+        
+        return sprite
     
     def _draw_info_panel(self, board, ship_count_input):
         """Draw information panel on the right"""
         panel_x = INFO_PANEL_X
         y_offset = 100
         
-        # Game status box
-        pygame.draw.rect(self.screen, (30, 30, 30), (panel_x - 10, y_offset - 10, 380, 150))
-        pygame.draw.rect(self.screen, YELLOW, (panel_x - 10, y_offset - 10, 380, 150), 2)
-        
-        info_title = self.font.render("GAME STATUS", True, YELLOW)
-        self.screen.blit(info_title, (panel_x, y_offset))
+        # Game status box (pre-rendered background, border and title)
+        self.screen.blit(self._status_box, (panel_x - 10, y_offset - 10))
         y_offset += 40
         
         # Planet counts
-        player_count = len(board.get_player_planets('player'))
-        ai_count = len(board.get_player_planets('ai'))
-        neutral_count = len([p for p in board.planets if p.owner is None])
+        player_count = board.count_by_owner(OWNER_PLAYER)
+        ai_count = board.count_by_owner(OWNER_AI)
+        neutral_count = board.count_by_owner(OWNER_NEUTRAL)
         
         # Label based on mode
         player_label = "AI Blue" if board.ai_vs_ai else "Player"
         ai_label = "AI Red"
         
         pygame.draw.circle(self.screen, BLUE, (panel_x - 5, y_offset + 10), 8)
-        player_info = self.small_font.render(f"{player_label} Planets: {player_count}", True, WHITE)
+        player_info = self._text(self.small_font, f"{player_label} Planets: {player_count}", WHITE)
         self.screen.blit(player_info, (panel_x + 15, y_offset))
         y_offset += 30
         
         pygame.draw.circle(self.screen, RED, (panel_x - 5, y_offset + 10), 8)
-        ai_info = self.small_font.render(f"{ai_label} Planets: {ai_count}", True, WHITE)
+        ai_info = self._text(self.small_font, f"{ai_label} Planets: {ai_count}", WHITE)
         self.screen.blit(ai_info, (panel_x + 15, y_offset))
         y_offset += 30
         
         pygame.draw.circle(self.screen, LIGHT_GRAY, (panel_x - 5, y_offset + 10), 8)
-        neutral_info = self.small_font.render(f"Neutral: {neutral_count}", True, WHITE)
+        neutral_info = self._text(self.small_font, f"Neutral: {neutral_count}", WHITE)
         self.screen.blit(neutral_info, (panel_x + 15, y_offset))
         y_offset += 30
         
@@ -191,7 +343,7 @@ class UIRenderer:
         pygame.draw.rect(self.screen, GREEN, (panel_x, y_offset, int(bar_width * turn_progress), bar_height))
         pygame.draw.rect(self.screen, WHITE, (panel_x, y_offset, bar_width, bar_height), 1)
         
-        turn_text = self.small_font.render(f"Turn {board.turn // 2 + 1} / 15", True, WHITE)
+        turn_text = self._text(self.small_font, f"Turn {board.turn // 2 + 1} / 15", WHITE)
         self.screen.blit(turn_text, (panel_x + bar_width + 10, y_offset))
         y_offset += 50
         
@@ -207,37 +359,30 @@ class UIRenderer:
         pygame.draw.rect(self.screen, (30, 30, 30), (panel_x - 10, y_offset - 10, 380, 180))
         pygame.draw.rect(self.screen, PURPLE, (panel_x - 10, y_offset - 10, 380, 180), 2)
         
-        select_title = self.font.render("SELECTED PLANET", True, PURPLE)
+        select_title = self._text(self.font, "SELECTED PLANET", PURPLE)
         self.screen.blit(select_title, (panel_x, y_offset))
         y_offset += 40
         
         # Owner
-        owner_text = "Neutral"
-        owner_color = LIGHT_GRAY
-        if planet.owner == 'player':
-            owner_text = "Player"
-            owner_color = BLUE
-        elif planet.owner == 'ai':
-            owner_text = "AI"
-            owner_color = RED
-        
-        owner_info = self.small_font.render(f"Owner: {owner_text}", True, owner_color)
+        owner_text, owner_color = _OWNER_LABEL[planet.owner]
+        
+        owner_info = self._text(self.small_font, f"Owner: {owner_text}", owner_color)
         self.screen.blit(owner_info, (panel_x, y_offset))
         y_offset += 30
         
         # Position
-        pos_info = self.small_font.render(f"Position: {planet.get_position()}", True, WHITE)
+        pos_info = self._text(self.small_font, f"Position: {planet.get_position()}", WHITE)
         self.screen.blit(pos_info, (panel_x, y_offset))
         y_offset += 30
         
         # Size
         size_text = "★" * planet.size + "☆" * (3 - planet.size)
-        size_info = self.small_font.render(f"Size: {size_text}", True, YELLOW)
+        size_info = self._text(self.small_font, f"Size: {size_text}", YELLOW)
         self.screen.blit(size_info, (panel_x, y_offset))
         y_offset += 30
         
         # Ships with capacity bar
-        ships_info = self.small_font.render(f"Ships: {planet.ships} / {planet.max_ships}", True, WHITE)
+        ships_info = self._text(self.small_font, f"Ships: {planet.ships} / {planet.max_ships}", WHITE)
         self.screen.blit(ships_info, (panel_x, y_offset))
         y_offset += 25
         
@@ -251,38 +396,26 @@ class UIRenderer:
         
         return y_offset + 30
     
-    def _draw_controls(self, panel_x, y_offset, ship_count_input, ai_vs_ai=False):
-        """Draw control instructions"""
-        pygame.draw.rect(self.screen, (30, 30, 30), (panel_x - 10, y_offset - 10, 380, 200))
-        pygame.draw.rect(self.screen, ORANGE, (panel_x - 10, y_offset - 10, 380, 200), 2)
-        
-        inst_title = self.font.render("CONTROLS", True, ORANGE)
-        self.screen.blit(inst_title, (panel_x, y_offset))
-        y_offset += 35
-        
-        if ai_vs_ai:
-            instructions = [
-                "• Watch AI agents battle!",
-                "• SPACE to pause/resume",
-                "• + to speed up",
-                "• - to slow down",
-                "• R to restart",
-                "• ESC for menu"
-            ]
-        else:
-            instructions = [
-                "• Click planet to select",
-                "• Click target to choose",
-                "• Type ships to send",
-                "• ENTER to confirm attack",
-                "• SPACE to end turn",
-                "• F for fuzzy analysis"
-            ]
+    def _build_controls(self, instructions):
+        """Render the static controls box (380x200, drawn at panel_x - 10, y - 10)"""
+        surface = pygame.Surface((380, 200))
+        surface.fill((30, 30, 30))
+        pygame.draw.rect(surface, ORANGE, (0, 0, 380, 200), 2)
         
+        inst_title = self._text(self.font, "CONTROLS", ORANGE)
+        surface.blit(inst_title, (10, 10))
+        
+        y_offset = 45
         for inst in instructions:
-            inst_text = self.small_font.render(inst, True, WHITE)
-            self.screen.blit(inst_text, (panel_x, y_offset))
+            inst_text = self._text(self.small_font, inst, WHITE)
+            surface.blit(inst_text, (10, y_offset))
             y_offset += 23
+        return surface
+    
+    def _draw_controls(self, panel_x, y_offset, ship_count_input, ai_vs_ai=False):
+        """Draw control instructions"""
+        self.screen.blit(self._controls_surfaces[ai_vs_ai], (panel_x - 10, y_offset - 10))
+        y_offset += 35 + 23 * len(AIVAI_INSTRUCTIONS if ai_vs_ai else PVAI_INSTRUCTIONS)
         
         # Ship input display (only for player mode)
         if ship_count_input and not ai_vs_ai:
@@ -291,12 +424,12 @@ class UIRenderer:
             pygame.draw.rect(self.screen, (20, 80, 20), input_bg)
             pygame.draw.rect(self.screen, GREEN, input_bg, 2)
             
-            input_text = self.font.render(f"Ships: {ship_count_input}", True, GREEN)
+            input_text = self._text(self.font, f"Ships: {ship_count_input}", GREEN)
             self.screen.blit(input_text, (panel_x, y_offset))
     
     def _draw_message(self, message_display):
         """Draw status message at bottom of screen"""
-        msg_surface = self.font.render(message_display, True, GREEN)
+        msg_surface = self._text(self.font, message_display, GREEN)
         msg_rect = msg_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
         
         bg_rect = msg_rect.inflate(20, 10)
@@ -322,10 +455,10 @@ class UIRenderer:
             result_text = "AI RED WINS!"
             color = RED
         
-        result = self.large_font.render(result_text, True, color)
+        result = self._text(self.large_font, result_text, color)
         result_rect = result.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
         self.screen.blit(result, result_rect)
         
-        restart_text = self.font.render("Press R to restart or ESC for menu", True, WHITE)
+        restart_text = self._text(self.font, "Press R to restart or ESC for menu", WHITE)
         restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
         self.screen.blit(restart_text, restart_rect)
\ No newline at end of file